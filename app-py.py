@@ -6,9 +6,17 @@ and orchestrates the application's functionality.
 """
 
 import datetime
+import hashlib
+import json
+import math
 import os
 import calendar
+import multiprocessing
+import queue
+import sys
+import threading
 import tkinter as tk
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 from tkcalendar import DateEntry
 
@@ -16,6 +24,271 @@ from tkcalendar import DateEntry
 from .calculator import BusinessTaxCalculator
 from .pdf_extractor import PdfInvoiceExtractor
 
+# Separator used when several PDF paths are shown in the path entry
+PDF_PATH_SEPARATOR = "; "
+
+
+def user_cache_dir():
+    """
+    Per-user directory for cached PDF extraction results
+    
+    Returns:
+        str: Platform cache location for the app
+    """
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, "InvoiceTaxApp", "pdfcache")
+
+
+def pdf_digest(pdf_path):
+    """
+    Hash a PDF's contents
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        
+    Returns:
+        str: SHA-256 hex digest of the file
+    """
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def extract_pdfs(pdf_paths, cache_dir, report):
+    """
+    Extract invoices from several PDFs, one worker process per file
+    
+    Results are cached in cache_dir as JSON, keyed by the PDF's content hash
+    and the extractor's backend and version, so importing the same file again
+    skips parsing entirely until the extraction logic changes.
+    
+    Args:
+        pdf_paths (List[str]): Paths to the PDF files
+        cache_dir (str): Directory for cached extraction results
+        report (callable): Called with (pdf_path, invoices) as each file finishes
+        
+    Returns:
+        int: Total number of invoices found
+    """
+    total = 0
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        cache_available = True
+    except OSError as e:
+        # Without a cache every file is a miss and its result isn't stored
+        print(f"PDF cache unavailable: {e}")
+        cache_available = False
+    
+    cache_suffix = f"-{PdfInvoiceExtractor.BACKEND}-v{PdfInvoiceExtractor.VERSION}.json"
+    
+    # Serve previously extracted files from the cache
+    cache_files = {}
+    for pdf_path in pdf_paths:
+        cache_file = os.path.join(cache_dir, pdf_digest(pdf_path) + cache_suffix)
+        try:
+            with open(cache_file, 'rb') as f:
+                invoices = [
+                    {
+                        'date': datetime.date.fromisoformat(inv['date']),
+                        'amount': float(inv['amount']),
+                        'description': str(inv['description']),
+                        'currency': str(inv['currency']),
+                        'doc_number': str(inv['doc_number']),
+                    }
+                    for inv in json.load(f)
+                ]
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing, unreadable or malformed entries are extracted again
+            cache_files[pdf_path] = cache_file
+            continue
+        report((pdf_path, invoices))
+        total += len(invoices)
+    
+    def finish(pdf_path, invoices):
+        # Failed extractions also come back empty, so only cache real results
+        if invoices and cache_available:
+            cache_file = cache_files[pdf_path]
+            records = [
+                {
+                    'date': inv['date'].isoformat(),
+                    'amount': inv['amount'],
+                    'description': inv['description'],
+                    'currency': inv['currency'],
+                    'doc_number': inv['doc_number'],
+                }
+                for inv in invoices
+            ]
+            try:
+                with open(cache_file + ".tmp", 'w', encoding='utf-8') as f:
+                    json.dump(records, f)
+                os.replace(cache_file + ".tmp", cache_file)
+            except OSError as e:
+                print(f"Failed to cache extraction results: {e}")
+        report((pdf_path, invoices))
+        return len(invoices)
+    
+    pending = list(cache_files)
+    if not pending:
+        return total
+    
+    # A single file is not worth the process start-up cost
+    if len(pending) == 1 or (os.cpu_count() or 1) == 1:
+        for pdf_path, invoices in PdfInvoiceExtractor.extract_from_pdf_batch(pending):
+            total += finish(pdf_path, invoices)
+        return total
+    
+    with ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as ex:
+        # Files already run in parallel, so each one is extracted in its worker without its own pool
+        futures = {ex.submit(PdfInvoiceExtractor.extract_from_pdf, p, 1): p for p in pending}
+        for future in as_completed(futures):
+            total += finish(futures[future], future.result())
+    
+    return total
+
+
+class VirtualTreeview:
+    """
+    Keeps the full row list in Python and only materializes the rows
+    visible in the Treeview viewport.
+
+    Items are inserted with their model index as the item id, so
+    ``tree.selection()`` can be mapped straight back to ``rows``.
+    """
+
+    DEFAULT_ROW_HEIGHT = 20
+    
+    # Scroll and resize events are coalesced into one render per frame (~60fps)
+    RENDER_DELAY_MS = 16
+
+    def __init__(self, tree, scrollbar, format_row):
+        """
+        Initialize the virtual view
+
+        Args:
+            tree (ttk.Treeview): Treeview to render rows into
+            scrollbar (ttk.Scrollbar): Vertical scrollbar attached to the tree
+            format_row (callable): Maps (index, row) to a tuple of column values
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.format_row = format_row
+        self.rows = []
+        self.first = 0
+        self.last = 0
+        self._pending_render = None
+        self._target_first = 0
+
+        # Route all scrolling through the model instead of the tree
+        self.scrollbar.config(command=self._yview_proxy)
+        self.tree.configure(yscrollcommand=self._yscroll_proxy)
+        self.tree.bind('<Configure>', self._on_configure)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', self._on_mousewheel)
+        self.tree.bind('<Button-5>', self._on_mousewheel)
+
+    def set_rows(self, rows):
+        """Replace the backing rows and redraw the visible window"""
+        self.rows = rows
+        self.tree.delete(*self.tree.get_children())
+        self.last = self.first
+        self.scroll_to(self.first)
+
+    def visible_count(self):
+        """Number of rows that fit in the viewport"""
+        row_height = ttk.Style().lookup('Treeview', 'rowheight')
+        try:
+            row_height = int(row_height)
+        except (TypeError, ValueError):
+            row_height = self.DEFAULT_ROW_HEIGHT
+        return max(1, self.tree.winfo_height() // max(row_height, 1) + 1)
+
+    def redraw(self):
+        """Re-format the visible rows after the backing data changed in place"""
+        self.set_rows(self.rows)
+
+    def scroll_to(self, first):
+        """Render the window starting at row ``first``"""
+        count = self.visible_count()
+        first = max(0, min(first, len(self.rows) - count))
+        self._render_window(first, min(len(self.rows), first + count))
+
+    def _render_window(self, first, last):
+        """Delete rows outside [first, last) and insert the newly visible ones"""
+        stale = [str(i) for i in range(self.first, self.last) if not first <= i < last]
+        if stale:
+            self.tree.delete(*stale)
+
+        # Call the Tcl command directly to skip ttk.Treeview.insert's option marshalling
+        tk_call = self.tree.tk.call
+        wname = str(self.tree)
+        inserted = False
+        for i in range(first, last):
+            if self.first <= i < self.last:
+                continue
+            tk_call(wname, 'insert', '', i - first, '-id', str(i),
+                    '-values', self.format_row(i, self.rows[i]))
+            inserted = True
+
+        self.first, self.last = first, last
+        self._yscroll_proxy()
+        if inserted:
+            self.tree.update_idletasks()
+
+    def _yscroll_proxy(self, *args):
+        """Report the model position to the scrollbar instead of the tree's own"""
+        total = len(self.rows)
+        if total == 0:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.first / total, self.last / total)
+
+    def _schedule_scroll(self, first):
+        """Render the window at ``first`` on the next frame, merging with any pending request"""
+        self._target_first = first
+        if self._pending_render is None:
+            self._pending_render = self.tree.after(self.RENDER_DELAY_MS, self._flush_scroll)
+
+    def _flush_scroll(self):
+        """Render the most recently requested window"""
+        self._pending_render = None
+        self.scroll_to(self._target_first)
+
+    def _current_target(self):
+        """First row of the pending window, or of the rendered one if nothing is pending"""
+        return self.first if self._pending_render is None else self._target_first
+
+    def _yview_proxy(self, *args):
+        """Translate scrollbar commands into a row window"""
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self._schedule_scroll(int(float(args[1]) * len(self.rows)))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= self.visible_count()
+            self._schedule_scroll(self._current_target() + step)
+
+    def _on_configure(self, event):
+        """Grow or shrink the window when the tree is resized"""
+        self._schedule_scroll(self._current_target())
+
+    def _on_mousewheel(self, event):
+        """Scroll the model by three rows per wheel notch"""
+        if event.num == 4 or event.delta > 0:
+            self._schedule_scroll(self._current_target() - 3)
+        else:
+            self._schedule_scroll(self._current_target() + 3)
+        return "break"
+
+
 class InvoiceTaxApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -46,13 +319,24 @@ class InvoiceTaxApp(tk.Tk):
         self.notebook.add(self.sep_tab, text="SEP 401(k)")
         self.notebook.add(self.settings_tab, text="Settings")
         
-        # Setup each tab
+        # Year choices shared by the period selectors
+        self._current_year = datetime.date.today().year
+        self._year_values = tuple(range(self._current_year - 5, self._current_year + 2))
+        
+        # Default export location, shared by the invoices and settings tabs
+        self.export_dir_var = tk.StringVar(value=os.path.join(os.getcwd(), "exports"))
+        os.makedirs(self.export_dir_var.get(), exist_ok=True)
+        
+        # Setup the visible tab now; the others are built the first time they are selected
         self.setup_invoices_tab()
-        self.setup_import_tab()
-        self.setup_tax_calc_tab()
-        self.setup_reports_tab()
-        self.setup_sep_tab()
-        self.setup_settings_tab()
+        self._pending_tab_setup = {
+            str(self.import_tab): self.setup_import_tab,
+            str(self.tax_calc_tab): self.setup_tax_calc_tab,
+            str(self.reports_tab): self.setup_reports_tab,
+            str(self.sep_tab): self.setup_sep_tab,
+            str(self.settings_tab): self.setup_settings_tab,
+        }
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Create status bar
         self.status_var = tk.StringVar(value="Ready")
@@ -61,16 +345,32 @@ class InvoiceTaxApp(tk.Tk):
         
         # Set app icon and styling
         self.style = ttk.Style()
-        self.style.configure('TButton', padding=6)
-        self.style.configure('TLabel', padding=3)
-        self.style.configure('TEntry', padding=3)
+        styles = {
+            'TButton': {'padding': 6},
+            'TLabel': {'padding': 3},
+            'TEntry': {'padding': 3},
+        }
+        for style_name, options in styles.items():
+            self.style.configure(style_name, **options)
         
         # Store extracted invoices temporarily
         self.extracted_invoices = []
+        self.extracted_selected = bytearray()
+        self._extracted_columns = self._empty_extracted_columns()
+        
+        # Results from background workers, drained on the Tk main thread
+        self._worker_q = queue.Queue()
+        self._pending_workers = 0
         
         # Refresh data
         self.refresh_invoice_list()
     
+    def _on_tab_changed(self, event):
+        """Build a tab the first time it is selected"""
+        setup = self._pending_tab_setup.pop(self.notebook.select(), None)
+        if setup is not None:
+            setup()
+    
     def setup_invoices_tab(self):
         """Setup the invoices management tab"""
         frame = ttk.Frame(self.invoices_tab, padding="10")
@@ -88,14 +388,12 @@ class InvoiceTaxApp(tk.Tk):
         
         # Amount field
         ttk.Label(form_frame, text="Amount:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.amount_var = tk.StringVar()
-        self.amount_entry = ttk.Entry(form_frame, textvariable=self.amount_var, width=15)
+        self.amount_entry = ttk.Entry(form_frame, width=15)
         self.amount_entry.grid(row=1, column=1, sticky=tk.W, pady=5)
         
         # Description field
         ttk.Label(form_frame, text="Description:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.desc_var = tk.StringVar()
-        self.desc_entry = ttk.Entry(form_frame, textvariable=self.desc_var, width=25)
+        self.desc_entry = ttk.Entry(form_frame, width=25)
         self.desc_entry.grid(row=2, column=1, sticky=tk.W, pady=5)
         
         # Buttons
@@ -125,9 +423,15 @@ class InvoiceTaxApp(tk.Tk):
         self.invoice_tree.column('amount', width=100)
         self.invoice_tree.column('description', width=200)
         
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.invoice_tree.yview)
-        self.invoice_tree.configure(yscroll=scrollbar.set)
+        # Add scrollbar; rows are materialized on demand by the virtual view
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL)
+        self.invoice_view = VirtualTreeview(self.invoice_tree, scrollbar, self._format_invoice_row)
+        self._all_invoices = []
+        self._rendered_version = -1
+        self._bulk_in_progress = False
+        
+        # Formatted rows by invoice ID, reused across refreshes
+        self._fmt_cache = {}
         
         # Pack everything
         self.invoice_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -154,11 +458,16 @@ class InvoiceTaxApp(tk.Tk):
         file_frame = ttk.Frame(top_frame)
         file_frame.pack(fill=tk.X, pady=5)
         
-        self.pdf_path_var = tk.StringVar()
         ttk.Label(file_frame, text="PDF File:").pack(side=tk.LEFT, padx=5)
-        ttk.Entry(file_frame, textvariable=self.pdf_path_var, width=50).pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        self.pdf_path_entry = ttk.Entry(file_frame, width=50)
+        self.pdf_path_entry.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
         ttk.Button(file_frame, text="Browse...", command=self.browse_pdf).pack(side=tk.LEFT, padx=5)
-        ttk.Button(file_frame, text="Extract Invoices", command=self.extract_pdf_invoices).pack(side=tk.LEFT, padx=5)
+        self.extract_button = ttk.Button(file_frame, text="Extract Invoices", command=self.extract_pdf_invoices)
+        self.extract_button.pack(side=tk.LEFT, padx=5)
+        
+        # Extraction progress, advanced by the worker one file at a time
+        self.import_progress = ttk.Progressbar(top_frame, mode='determinate')
+        self.import_progress.pack(fill=tk.X, padx=5, pady=5)
         
         # Preview section
         preview_frame = ttk.LabelFrame(frame, text="Extracted Invoices Preview", padding="10")
@@ -184,9 +493,12 @@ class InvoiceTaxApp(tk.Tk):
         self.extracted_tree.column('currency', width=80)
         self.extracted_tree.column('description', width=200)
         
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(preview_frame, orient=tk.VERTICAL, command=self.extracted_tree.yview)
-        self.extracted_tree.configure(yscroll=scrollbar.set)
+        # Add scrollbar; rows are materialized on demand by the virtual view
+        scrollbar = ttk.Scrollbar(preview_frame, orient=tk.VERTICAL)
+        self.extracted_view = VirtualTreeview(self.extracted_tree, scrollbar, self._format_extracted_row)
+        
+        # One widget-level binding instead of a tag binding per row
+        self.extracted_tree.bind('<ButtonRelease-1>', self._on_extracted_click)
         
         # Pack treeview and scrollbar
         self.extracted_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -199,7 +511,8 @@ class InvoiceTaxApp(tk.Tk):
         ttk.Button(action_frame, text="Toggle Selected", command=self.toggle_selected_import).pack(side=tk.LEFT, padx=5)
         ttk.Button(action_frame, text="Select All", command=self.select_all_imports).pack(side=tk.LEFT, padx=5)
         ttk.Button(action_frame, text="Clear Selection", command=self.clear_all_imports).pack(side=tk.LEFT, padx=5)
-        ttk.Button(action_frame, text="Import Selected", command=self.import_selected_invoices).pack(side=tk.RIGHT, padx=5)
+        self.import_button = ttk.Button(action_frame, text="Import Selected", command=self.import_selected_invoices)
+        self.import_button.pack(side=tk.RIGHT, padx=5)
         
         # Log section for import process
         log_frame = ttk.LabelFrame(frame, text="Import Log", padding="10")
@@ -220,10 +533,9 @@ class InvoiceTaxApp(tk.Tk):
         select_frame.pack(fill=tk.X, pady=10)
         
         ttk.Label(select_frame, text="Year:").grid(row=0, column=0, padx=5, pady=5)
-        current_year = datetime.date.today().year
-        self.year_var = tk.StringVar(value=str(current_year))
+        self.year_var = tk.StringVar(value=str(self._current_year))
         year_combo = ttk.Combobox(select_frame, textvariable=self.year_var, width=6)
-        year_combo['values'] = tuple(range(current_year-5, current_year+2))
+        year_combo['values'] = self._year_values
         year_combo.grid(row=0, column=1, padx=5, pady=5)
         
         ttk.Label(select_frame, text="Quarter:").grid(row=0, column=2, padx=5, pady=5)
@@ -242,7 +554,8 @@ class InvoiceTaxApp(tk.Tk):
         results_text_frame = ttk.Frame(results_frame)
         results_text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        self.results_text = tk.Text(results_text_frame, wrap=tk.WORD, height=20, width=80)
+        self.results_text = tk.Text(results_text_frame, wrap=tk.NONE, height=20, width=80,
+                                    undo=False, maxundo=0, autoseparators=False)
         self.results_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         scrollbar = ttk.Scrollbar(results_text_frame, orient=tk.VERTICAL, command=self.results_text.yview)
@@ -262,10 +575,9 @@ class InvoiceTaxApp(tk.Tk):
         select_frame.pack(fill=tk.X, pady=10)
         
         ttk.Label(select_frame, text="Year:").grid(row=0, column=0, padx=5, pady=5)
-        current_year = datetime.date.today().year
-        self.report_year_var = tk.StringVar(value=str(current_year))
+        self.report_year_var = tk.StringVar(value=str(self._current_year))
         year_combo = ttk.Combobox(select_frame, textvariable=self.report_year_var, width=6)
-        year_combo['values'] = tuple(range(current_year-5, current_year+2))
+        year_combo['values'] = self._year_values
         year_combo.grid(row=0, column=1, padx=5, pady=5)
         
         ttk.Label(select_frame, text="Quarter:").grid(row=0, column=2, padx=5, pady=5)
@@ -285,7 +597,8 @@ class InvoiceTaxApp(tk.Tk):
         report_text_frame = ttk.Frame(report_frame)
         report_text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        self.report_text = tk.Text(report_text_frame, wrap=tk.WORD, height=20, width=80)
+        self.report_text = tk.Text(report_text_frame, wrap=tk.NONE, height=20, width=80,
+                                   undo=False, maxundo=0, autoseparators=False)
         self.report_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         scrollbar = ttk.Scrollbar(report_text_frame, orient=tk.VERTICAL, command=self.report_text.yview)
@@ -305,10 +618,9 @@ class InvoiceTaxApp(tk.Tk):
         select_frame.pack(fill=tk.X, pady=10)
         
         ttk.Label(select_frame, text="Year:").grid(row=0, column=0, padx=5, pady=5)
-        current_year = datetime.date.today().year
-        self.sep_year_var = tk.StringVar(value=str(current_year))
+        self.sep_year_var = tk.StringVar(value=str(self._current_year))
         year_combo = ttk.Combobox(select_frame, textvariable=self.sep_year_var, width=6)
-        year_combo['values'] = tuple(range(current_year-5, current_year+2))
+        year_combo['values'] = self._year_values
         year_combo.grid(row=0, column=1, padx=5, pady=5)
         
         ttk.Button(select_frame, text="Calculate", command=self.calculate_sep).grid(row=0, column=2, padx=20, pady=5)
@@ -321,7 +633,8 @@ class InvoiceTaxApp(tk.Tk):
         results_text_frame = ttk.Frame(results_frame)
         results_text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        self.sep_results_text = tk.Text(results_text_frame, wrap=tk.WORD, height=20, width=80)
+        self.sep_results_text = tk.Text(results_text_frame, wrap=tk.NONE, height=20, width=80,
+                                        undo=False, maxundo=0, autoseparators=False)
         self.sep_results_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         scrollbar = ttk.Scrollbar(results_text_frame, orient=tk.VERTICAL, command=self.sep_results_text.yview)
@@ -342,21 +655,21 @@ class InvoiceTaxApp(tk.Tk):
         
         # Federal tax rate
         ttk.Label(tax_frame, text="Federal Tax Rate (%):").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
-        self.fed_tax_rate_var = tk.StringVar(value=str(self.calculator.fed_tax_rate * 100))
-        fed_tax_entry = ttk.Entry(tax_frame, textvariable=self.fed_tax_rate_var, width=6)
-        fed_tax_entry.grid(row=0, column=1, padx=5, pady=5)
+        self.fed_tax_entry = ttk.Entry(tax_frame, width=6)
+        self.fed_tax_entry.insert(0, str(self.calculator.fed_tax_rate * 100))
+        self.fed_tax_entry.grid(row=0, column=1, padx=5, pady=5)
         
         # State tax rate
         ttk.Label(tax_frame, text="State Tax Rate (%):").grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
-        self.state_tax_rate_var = tk.StringVar(value=str(self.calculator.state_tax_rate * 100))
-        state_tax_entry = ttk.Entry(tax_frame, textvariable=self.state_tax_rate_var, width=6)
-        state_tax_entry.grid(row=1, column=1, padx=5, pady=5)
+        self.state_tax_entry = ttk.Entry(tax_frame, width=6)
+        self.state_tax_entry.insert(0, str(self.calculator.state_tax_rate * 100))
+        self.state_tax_entry.grid(row=1, column=1, padx=5, pady=5)
         
         # State code
         ttk.Label(tax_frame, text="State Code:").grid(row=2, column=0, padx=5, pady=5, sticky=tk.W)
-        self.state_code_var = tk.StringVar(value=self.calculator.state_code)
-        state_code_entry = ttk.Entry(tax_frame, textvariable=self.state_code_var, width=6)
-        state_code_entry.grid(row=2, column=1, padx=5, pady=5)
+        self.state_code_entry = ttk.Entry(tax_frame, width=6)
+        self.state_code_entry.insert(0, self.calculator.state_code)
+        self.state_code_entry.grid(row=2, column=1, padx=5, pady=5)
         
         ttk.Button(tax_frame, text="Update Tax Rates", command=self.update_tax_rates).grid(row=3, column=0, columnspan=2, padx=5, pady=10)
         
@@ -370,13 +683,9 @@ class InvoiceTaxApp(tk.Tk):
         ttk.Button(file_frame, text="Change...", command=self.change_data_file).grid(row=0, column=2, padx=5, pady=5)
         
         ttk.Label(file_frame, text="Default Export Location:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        self.export_dir_var = tk.StringVar(value=os.path.join(os.getcwd(), "exports"))
         ttk.Entry(file_frame, textvariable=self.export_dir_var, width=50, state="readonly").grid(row=1, column=1, padx=5, pady=5)
         ttk.Button(file_frame, text="Change...", command=self.change_export_dir).grid(row=1, column=2, padx=5, pady=5)
         
-        # Create export directory if it doesn't exist
-        os.makedirs(self.export_dir_var.get(), exist_ok=True)
-        
         # About section
         about_frame = ttk.LabelFrame(frame, text="About", padding="10")
         about_frame.pack(fill=tk.X, pady=10)
@@ -395,10 +704,14 @@ class InvoiceTaxApp(tk.Tk):
         try:
             # Get form values
             date = self.date_entry.get_date()
-            amount = float(self.amount_var.get())
-            description = self.desc_var.get()
+            amount = float(self.amount_entry.get())
+            description = self.desc_entry.get()
             
             # Validate
+            if not math.isfinite(amount):
+                messagebox.showerror("Invalid Input", "Amount must be a finite number")
+                return
+            
             if amount <= 0:
                 messagebox.showerror("Invalid Input", "Amount must be greater than zero")
                 return
@@ -407,97 +720,353 @@ class InvoiceTaxApp(tk.Tk):
                 messagebox.showerror("Invalid Input", "Description cannot be empty")
                 return
             
-            # Add invoice
-            success, message = self.calculator.add_invoice(date, amount, description)
-            
-            if success:
-                self.status_var.set(message)
-                self.clear_form()
-                self.refresh_invoice_list()
-            else:
-                messagebox.showerror("Error", message)
+            # Add invoice (saving touches disk, so run it off the main thread)
+            self.status_var.set("Saving invoice...")
+            self.run_in_background(self.calculator.add_invoice, (date, amount, description),
+                                   on_done=self._on_invoice_added)
                 
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter a valid numeric amount")
     
+    def _on_invoice_added(self, result):
+        """Handle the result of a background add_invoice call"""
+        success, message = result
+        
+        if success:
+            self.status_var.set(message)
+            self.clear_form()
+            self.refresh_invoice_list()
+        else:
+            messagebox.showerror("Error", message)
+    
+    def delete_invoice(self):
+        """Delete the invoices selected in the invoice list"""
+        selection = self.invoice_tree.selection()
+        if not selection:
+            messagebox.showinfo("Selection Required", "Please select an invoice to delete")
+            return
+        
+        invoice_ids = [self._all_invoices[int(item)].invoice_id for item in selection]
+        if not messagebox.askyesno("Confirm Delete", f"Delete {len(invoice_ids)} selected invoice(s)?"):
+            return
+        
+        for invoice_id in invoice_ids:
+            self._fmt_cache.pop(invoice_id, None)
+        
+        # One worker and one save for the whole selection
+        self.run_in_background(self.calculator.delete_invoices_bulk, (invoice_ids,),
+                               on_done=self._on_invoices_deleted)
+    
+    def _on_invoices_deleted(self, result):
+        """Handle the result of a background bulk delete"""
+        success, message = result
+        self.status_var.set(message)
+        self.refresh_invoice_list()
+    
+    def export_csv(self):
+        """Export all invoices to a CSV file"""
+        filename = filedialog.asksaveasfilename(
+            initialdir=self.export_dir_var.get(),
+            title="Export invoices",
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        
+        if not filename:
+            return
+        
+        self.status_var.set("Exporting invoices...")
+        self.run_in_background(self.calculator.export_to_csv, (filename,), on_done=self._on_csv_exported)
+    
+    def _on_csv_exported(self, result):
+        """Handle the result of a background CSV export"""
+        success, message = result
+        
+        if success:
+            self.status_var.set(message)
+        else:
+            messagebox.showerror("Export Failed", message)
+    
+    def change_data_file(self):
+        """Move the invoice data file to a new location"""
+        filename = filedialog.asksaveasfilename(
+            initialdir=os.path.dirname(os.path.abspath(self.calculator.data_file)),
+            initialfile=os.path.basename(self.calculator.data_file),
+            title="Choose data file location",
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        
+        if not filename:
+            return
+        
+        self.status_var.set("Moving data file...")
+        self.run_in_background(self.calculator.change_data_location, (filename,), on_done=self._on_data_file_changed)
+    
+    def _on_data_file_changed(self, result):
+        """Handle the result of a background data file move"""
+        success, message = result
+        
+        if success:
+            self.data_file_var.set(self.calculator.data_file)
+            self.status_var.set(message)
+        else:
+            messagebox.showerror("Error", message)
+    
     def browse_pdf(self):
         """Browse for a PDF file"""
-        filename = filedialog.askopenfilename(
+        filenames = filedialog.askopenfilenames(
             initialdir=os.getcwd(),
-            title="Select PDF file",
+            title="Select PDF files",
             filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
         )
         
-        if filename:
-            self.pdf_path_var.set(filename)
+        if filenames:
+            self.pdf_path_entry.delete(0, tk.END)
+            self.pdf_path_entry.insert(0, PDF_PATH_SEPARATOR.join(filenames))
     
     def extract_pdf_invoices(self):
-        """Extract invoices from the selected PDF file"""
-        pdf_path = self.pdf_path_var.get()
+        """Extract invoices from the selected PDF files"""
+        pdf_paths = [p.strip() for p in self.pdf_path_entry.get().split(PDF_PATH_SEPARATOR.strip()) if p.strip()]
         
-        if not pdf_path:
+        if not pdf_paths:
             messagebox.showinfo("Selection Required", "Please select a PDF file first")
             return
-            
-        if not os.path.exists(pdf_path):
-            messagebox.showerror("File Not Found", f"The file '{pdf_path}' does not exist")
-            return
+        
+        for pdf_path in pdf_paths:
+            if not os.path.exists(pdf_path):
+                messagebox.showerror("File Not Found", f"The file '{pdf_path}' does not exist")
+                return
             
         # Clear previous data
-        for item in self.extracted_tree.get_children():
-            self.extracted_tree.delete(item)
+        self.extracted_invoices = []
+        self.extracted_selected = bytearray()
+        self._extracted_columns = self._empty_extracted_columns()
+        self.extracted_view.set_rows(self.extracted_invoices)
             
-        self.update_import_log("Extracting invoices from PDF...", clear=True)
+        self.update_import_log(f"Extracting invoices from {len(pdf_paths)} PDF file(s)...", clear=True)
+        self.import_progress.configure(maximum=len(pdf_paths), value=0)
         
-        # Extract invoices from PDF
-        invoices = PdfInvoiceExtractor.extract_from_pdf(pdf_path)
+        # One run at a time: results stream into the shared preview, and
+        # importing a half-filled preview would miss the later files
+        self.extract_button.state(['disabled'])
+        self.import_button.state(['disabled'])
+        
+        # Extract invoices without blocking the mainloop; results stream in per file
+        self.run_in_background(extract_pdfs, (pdf_paths, user_cache_dir()), on_done=self._on_pdf_extracted,
+                               on_error=self._on_pdf_extract_error, on_partial=self._on_pdf_partial)
+    
+    def _on_pdf_partial(self, result):
+        """Append the invoices extracted from one PDF to the preview"""
+        pdf_path, invoices = result
+        self.import_progress['value'] += 1
+        self.update_import_log(f"Found {len(invoices)} invoices in {os.path.basename(pdf_path)}.")
         
         if not invoices:
+            return
+        
+        # Store extracted invoices and update the tree (all selected by default)
+        self.extracted_invoices.extend(invoices)
+        self.extracted_selected.extend(b'\x01' * len(invoices))
+        self._append_extracted_columns(invoices)
+        self.extracted_view.set_rows(self.extracted_invoices)
+    
+    def _on_pdf_extracted(self, total):
+        """Finish a background PDF extraction"""
+        self._pdf_extraction_finished()
+        if not total:
             self.update_import_log("No invoices found in the PDF.")
             return
             
-        # Store extracted invoices and update the tree
-        self.extracted_invoices = invoices
-        self.update_import_log(f"Found {len(invoices)} invoices in the PDF.")
-        
-        for i, inv in enumerate(invoices):
-            item_id = self.extracted_tree.insert('', 'end', values=(
-                "✓",  # Default to selected
-                inv['date'].isoformat(),
-                inv['doc_number'],
-                f"{inv['amount']:.2f}",
-                inv['currency'],
-                inv['description']
-            ))
-            
-            # Bind toggle event to the first column
-            self.extracted_tree.tag_bind(item_id, '<ButtonRelease-1>', self.toggle_import_selection)
-            
         self.update_import_log("Review the extracted invoices and click 'Import Selected' to add them to your system.")
     
+    def _on_pdf_extract_error(self, exc):
+        """Report a failed background PDF extraction"""
+        self._pdf_extraction_finished()
+        self.import_progress['value'] = 0
+        self.update_import_log(f"Error extracting invoices: {exc}")
+    
+    def _pdf_extraction_finished(self):
+        """Allow extracting and importing again once a run has ended"""
+        self.extract_button.state(['!disabled'])
+        if not self._bulk_in_progress:
+            self.import_button.state(['!disabled'])
+    
+    def run_in_background(self, func, args=(), on_done=None, on_error=None, on_partial=None):
+        """
+        Run a blocking call on a worker thread
+        
+        The callbacks are invoked from the Tk main thread by the queue poller,
+        so they are free to touch widgets. The worker itself never does.
+        
+        Args:
+            func (callable): Function to run on the worker thread
+            args (tuple): Positional arguments for func
+            on_done (callable, optional): Called with the return value of func
+            on_error (callable, optional): Called with the raised exception
+            on_partial (callable, optional): If given, func receives a ``report``
+                callable as its last argument and every value passed to it is
+                delivered to on_partial
+        """
+        if on_partial is not None:
+            result_q = self._worker_q
+            args = tuple(args) + (lambda payload: result_q.put(('partial', on_partial, payload)),)
+        
+        threading.Thread(target=self._background_worker, args=(func, args, on_done, on_error, self._worker_q),
+                         daemon=True).start()
+        
+        self._pending_workers += 1
+        if self._pending_workers == 1:
+            self.after(50, self._poll_worker_queue)
+    
+    @staticmethod
+    def _background_worker(func, args, on_done, on_error, result_q):
+        """Worker thread body: run func and post the outcome to the queue"""
+        try:
+            result_q.put(('done', on_done, func(*args)))
+        except Exception as e:
+            result_q.put(('error', on_error, e))
+    
+    def _poll_worker_queue(self):
+        """Drain finished worker results on the Tk main thread"""
+        while True:
+            try:
+                status, callback, payload = self._worker_q.get_nowait()
+            except queue.Empty:
+                break
+            
+            if status != 'partial':
+                self._pending_workers -= 1
+            # A failing callback must not stop the poller, or every later
+            # worker result would be dropped
+            try:
+                if callback is not None:
+                    callback(payload)
+                elif status == 'error':
+                    messagebox.showerror("Error", str(payload))
+            except Exception as e:
+                messagebox.showerror("Error", str(e))
+        
+        if self._pending_workers > 0:
+            self.after(50, self._poll_worker_queue)
+    
     # Add all your other methods here...
     
     def clear_form(self):
         """Clear the invoice form"""
         self.date_entry.set_date(datetime.date.today())
-        self.amount_var.set("")
-        self.desc_var.set("")
+        self.amount_entry.delete(0, tk.END)
+        self.desc_entry.delete(0, tk.END)
     
     def refresh_invoice_list(self):
         """Refresh the invoice list display"""
-        # Clear the treeview
-        for item in self.invoice_tree.get_children():
-            self.invoice_tree.delete(item)
-        
-        # Add all invoices
-        invoices = self.calculator.get_all_invoices()
-        for inv in invoices:
-            self.invoice_tree.insert('', 'end', values=(
-                inv.invoice_id,
-                inv.date.isoformat(),
-                f"${inv.amount:.2f}",
-                inv.description
-            ))
+        # Nothing changed since the last refresh, or a bulk import will refresh once it finishes
+        if self._rendered_version == self.calculator.version or self._bulk_in_progress:
+            return
+        
+        # Keep the full list in Python; only the visible window is inserted
+        self._all_invoices = self.calculator.get_all_invoices()
+        self._rendered_version = self.calculator.version
+        self.invoice_view.set_rows(self._all_invoices)
+    
+    def _format_invoice_row(self, index, inv):
+        """Format an invoice for the invoice list, caching the result"""
+        cached = self._fmt_cache.get(inv.invoice_id)
+        # Check identity too, since generated invoice IDs can be reused after a delete
+        if cached is not None and cached[0] is inv:
+            return cached[1]
+        
+        row = (
+            inv.invoice_id,
+            inv.date.isoformat(),
+            f"${inv.amount:.2f}",
+            inv.description
+        )
+        self._fmt_cache[inv.invoice_id] = (inv, row)
+        return row
+    
+    @staticmethod
+    def _empty_extracted_columns():
+        """Create empty display columns for the import preview"""
+        return {'dates': [], 'doc_numbers': [], 'amounts': [], 'currencies': [], 'descriptions': []}
+    
+    def _append_extracted_columns(self, invoices):
+        """Pre-format extracted invoices into the parallel display columns"""
+        columns = self._extracted_columns
+        columns['dates'].extend(inv['date'].isoformat() for inv in invoices)
+        columns['doc_numbers'].extend(inv['doc_number'] for inv in invoices)
+        columns['amounts'].extend(f"{inv['amount']:.2f}" for inv in invoices)
+        columns['currencies'].extend(inv['currency'] for inv in invoices)
+        columns['descriptions'].extend(inv['description'] for inv in invoices)
+    
+    def _format_extracted_row(self, index, inv):
+        """Format an extracted invoice for the import preview from the display columns"""
+        columns = self._extracted_columns
+        return (
+            "✓" if self.extracted_selected[index] else "",
+            columns['dates'][index],
+            columns['doc_numbers'][index],
+            columns['amounts'][index],
+            columns['currencies'][index],
+            columns['descriptions'][index]
+        )
+    
+    def _on_extracted_click(self, event):
+        """Toggle the import flag when the Import column of a row is clicked"""
+        item = self.extracted_tree.identify_row(event.y)
+        col = self.extracted_tree.identify_column(event.x)
+        if not item or col != '#1':
+            return
+        
+        index = int(item)
+        self.extracted_selected[index] ^= 1
+        self.extracted_tree.set(item, 'select', "✓" if self.extracted_selected[index] else "")
+    
+    def toggle_selected_import(self):
+        """Toggle the import flag of the highlighted preview rows"""
+        for item in self.extracted_tree.selection():
+            self.extracted_selected[int(item)] ^= 1
+        self.extracted_view.redraw()
+    
+    def select_all_imports(self):
+        """Mark every extracted invoice for import"""
+        self.extracted_selected[:] = b'\x01' * len(self.extracted_selected)
+        self.extracted_view.redraw()
+    
+    def clear_all_imports(self):
+        """Unmark every extracted invoice"""
+        self.extracted_selected[:] = bytes(len(self.extracted_selected))
+        self.extracted_view.redraw()
+    
+    def import_selected_invoices(self):
+        """Add the extracted invoices marked for import"""
+        selected = [inv for inv, flag in zip(self.extracted_invoices, self.extracted_selected) if flag]
+        if not selected:
+            messagebox.showinfo("Selection Required", "No invoices are selected for import")
+            return
+        
+        self.update_import_log(f"Importing {len(selected)} invoices...")
+        self.status_var.set(f"Importing {len(selected)} invoices...")
+        rows = [(inv['date'], inv['amount'], inv['description']) for inv in selected]
+        self._bulk_in_progress = True
+        # Overlapping imports would add the rows twice
+        self.import_button.state(['disabled'])
+        self.run_in_background(self.calculator.add_invoices_bulk, (rows,), on_done=self._on_invoices_imported,
+                               on_error=lambda e: self._on_invoices_imported((False, f"Error adding invoices: {e}")))
+    
+    def _on_invoices_imported(self, result):
+        """Report the outcome of a background import"""
+        self._bulk_in_progress = False
+        if self.extract_button.instate(['!disabled']):
+            self.import_button.state(['!disabled'])
+        success, message = result
+        self.update_import_log(message)
+        self.status_var.set(message)
+        
+        # A failed import may still have added the rows before the failure
+        self.refresh_invoice_list()
+        if not success:
+            messagebox.showerror("Import Failed", message)
     
     def update_import_log(self, message, clear=False):
         """Update the import log with a message"""
@@ -510,8 +1079,11 @@ class InvoiceTaxApp(tk.Tk):
 
 def main():
     """Main entry point for the application"""
+    # Needed for the extraction process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     app = InvoiceTaxApp()
     app.mainloop()
+    app.calculator.close()
 
 if __name__ == "__main__":
     main()
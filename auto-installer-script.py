@@ -3,7 +3,11 @@ import sys
 import subprocess
 import platform
 import argparse
+import base64
+import hashlib
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Application constants
@@ -12,6 +16,54 @@ APP_VERSION = "1.0.0"
 APP_DESCRIPTION = "Business invoice management and tax calculation application"
 GITHUB_REPO = "https://github.com/YOUR_USERNAME/InvoiceTaxApp"
 
+# PyInstaller keeps its analysis here between builds so rebuilds are incremental
+PYI_WORKPATH = "build/pyi-cache"
+
+# Build state kept between runs (pip wheel cache, fingerprints)
+BUILD_CACHE_DIR = ".build-cache"
+
+# Bump when the generated icon's drawing changes so existing copies are redrawn
+ICON_SIGNATURE = f"{APP_NAME}-{APP_VERSION}-v1"
+
+# Environment for every build subprocess, built once
+_BUILD_ENV = {
+    **os.environ,
+    "PYTHONDONTWRITEBYTECODE": "1",
+    "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+}
+# Keep downloaded wheels in a stable place so later runs reuse them
+_BUILD_ENV.setdefault("PIP_CACHE_DIR", os.path.abspath(os.path.join(BUILD_CACHE_DIR, "pip")))
+# PyInstaller runs with -OO so bundled modules are compiled without docstrings and asserts
+_PYINSTALLER_ENV = {**_BUILD_ENV, "PYTHONOPTIMIZE": "2"}
+
+# Standard Inno Setup install directories, searched before PATH
+INNO_SETUP_DIRS = [
+    r"C:\Program Files\Inno Setup 6",
+    r"C:\Program Files (x86)\Inno Setup 6",
+    r"C:\Program Files\Inno Setup 5",
+    r"C:\Program Files (x86)\Inno Setup 5",
+]
+# Memoized result of _find_iscc(); "" means Inno Setup was not found
+_ISCC_PATH = None
+
+# The default 256x256 icon as PNG; _draw_icon() renders the same image
+_ICON_PNG_B64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAC2UlEQVR42u3dsQ2CQBSAYTF0bMAG"
+    "rmBrS2LPKAzgKPQktrSswAZuYH0u4FUIcsf3DWDkQf686q4IIZyAYzobAQgAIACAAAACAAgAIACA"
+    "AAACAAgAIACAAAACAAgAIACAAAACAAgAIACAAAACAAgAIACAAAACAAgAIACAAAACAAgAIACAAAAC"
+    "AAgAIACAAAACAAIACABwPOXe/2Dd9MFrImWvZ1vYAAABAAQAEABAAAABAAQA2EiZ+gNcrndvkb+a"
+    "p8EGAAgAIACAAAACAAgAIACAAAACAAgAIACAAAACAAgAIACAAAACAAgAIACAAAACAAgAIACAAAAC"
+    "AAgAIAAgAIAAAAIACACQv9IIvhu7yhAyc3u8DcEGAAgAIAAgAIAAAAIACAAgAIAAAAIACAAgAIAA"
+    "AAIACAAgAIAAAAIACAAgAIAAAAIACAAgAIAAAAIACAAgAIAAAAIALOR68AhXSWMDAAQAEABAAAAB"
+    "AAQAEABAAAABAAQAEABAAAABAAQAEABAAAABAAQA2IYjwSLGrjKEzDjmzQYACAAgACAAgAAAAgAI"
+    "ACAAgAAAAgAIACAAgAAAAgAIACAAgAAAAgAIACAAgAAAAgAIACAAgAAAAgAIACAAgAAAAgAs53rw"
+    "CFdJYwMABAAQAEAAAAEABAAQAEAAAAEABAAQAEAAAAEABAAQAEAAAAEABADYhiPBIsauMoTMOObN"
+    "BgAIACAAIACAAAACAAgAIACAAAACAAgAIACAAAACAAgAIACAAAACAAgAIACAAAACAAgAIACAAAAC"
+    "AAgAIADAryV/Oeg8DSv9cuvryMx634oNALAB5KNuekPABgAIACAAgAAAAgCkrQghmALYAAABAAQA"
+    "EABAAAABAAQAEABAAAABAAQAEABAAAABAAQAEABAAAABAAQAEABAAAABAAQAEABAAAABAAQAEABA"
+    "AAABAAQAEABAAAABAAQAEAAQAEAAgIP5ALS6IYkQ3h+sAAAAAElFTkSuQmCC"
+)
+
 def check_python_version():
     """Check if Python version is compatible"""
     required_version = (3, 7)
@@ -24,59 +76,133 @@ def check_python_version():
     
     print(f"Python version check passed: {current_version[0]}.{current_version[1]}.{current_version[2]}")
 
-def install_dependencies(verbose=False):
-    """Install required dependencies"""
+def _run(args, verbose=False, env=None):
+    """Run a build command, raising CalledProcessError if it fails"""
+    subprocess.run(args, check=True, env=env or _BUILD_ENV, stdout=None if verbose else subprocess.DEVNULL, close_fds=False)
+
+def _requirements_fingerprint():
+    """Hash of requirements.txt and the interpreter it is installed into"""
+    # A recreated venv keeps the Python version but not its packages, so the
+    # environment's location is part of the hash
+    interpreter = "\0".join([sys.version, sys.prefix, sys.executable]).encode()
+    return hashlib.sha256(Path("requirements.txt").read_bytes() + interpreter).hexdigest()
+
+def _requirements_installed():
+    """Check that every distribution named in requirements.txt is installed"""
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:
+        # Python 3.7 has no importlib.metadata; let pip decide
+        return False
+    
+    for line in Path("requirements.txt").read_text().splitlines():
+        match = re.match(r"[A-Za-z0-9][A-Za-z0-9._-]*", line.strip())
+        if not match:
+            continue
+        try:
+            version(match.group(0))
+        except PackageNotFoundError:
+            return False
+    return True
+
+def install_dependencies(verbose=False, force=False):
+    """Install required dependencies unless they were installed from the same requirements.txt into this environment"""
+    fingerprint = _requirements_fingerprint()
+    fingerprint_file = Path(BUILD_CACHE_DIR) / "req.sha"
+    
+    if not force:
+        try:
+            if fingerprint_file.read_text() == fingerprint and _requirements_installed():
+                print("Dependencies up to date (cache hit)")
+                return
+        except OSError:
+            pass
+    
     print("Installing dependencies...")
     
-    pip_args = [sys.executable, "-m", "pip", "install", "--upgrade", "pip"]
-    if verbose:
-        subprocess.check_call(pip_args)
-    else:
-        subprocess.check_call(pip_args, stdout=subprocess.DEVNULL)
+    # Only pip itself is upgraded; requirements already satisfied are left as they are
+    _run([sys.executable, "-m", "pip", "install", "--upgrade", "--disable-pip-version-check", "pip"], verbose)
+    _run([sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "--prefer-binary",
+          "-r", "requirements.txt"], verbose)
     
-    requirements_args = [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]
-    if verbose:
-        subprocess.check_call(requirements_args)
-    else:
-        subprocess.check_call(requirements_args, stdout=subprocess.DEVNULL)
+    fingerprint_file.parent.mkdir(parents=True, exist_ok=True)
+    fingerprint_file.write_text(fingerprint)
     
     print("All dependencies installed successfully.")
 
+def _draw_icon():
+    """Draw the default invoice icon"""
+    from PIL import Image, ImageDraw
+    
+    # Create a simple icon
+    img = Image.new('RGBA', (256, 256), color=(255, 255, 255, 0))
+    draw = ImageDraw.Draw(img)
+    
+    # Drawing a simple invoice icon
+    draw.rectangle([40, 40, 216, 216], fill=(66, 133, 244, 255), outline=(25, 75, 165, 255), width=8)
+    draw.rectangle([70, 80, 186, 110], fill=(255, 255, 255, 255))
+    draw.rectangle([70, 130, 186, 160], fill=(255, 255, 255, 255))
+    draw.rectangle([70, 180, 186, 210], fill=(255, 255, 255, 255))
+    return img
+
 def create_icon_if_missing():
-    """Create a basic icon if none exists"""
+    """Create a basic icon if none exists, or redraw a generated one that is out of date"""
     resources_dir = Path("invoicetaxapp/resources")
     icon_path = resources_dir / "icon.ico"
+    sig_path = icon_path.with_suffix(".sig")
     
     if not resources_dir.exists():
         print(f"Creating resources directory: {resources_dir}")
         resources_dir.mkdir(parents=True, exist_ok=True)
     
-    if not icon_path.exists():
-        print("No icon found. Creating a basic icon...")
-        try:
-            from PIL import Image, ImageDraw
-            
-            # Create a simple icon
-            img = Image.new('RGBA', (256, 256), color=(255, 255, 255, 0))
-            draw = ImageDraw.Draw(img)
-            
-            # Drawing a simple invoice icon
-            draw.rectangle([40, 40, 216, 216], fill=(66, 133, 244, 255), outline=(25, 75, 165, 255), width=8)
-            draw.rectangle([70, 80, 186, 110], fill=(255, 255, 255, 255))
-            draw.rectangle([70, 130, 186, 160], fill=(255, 255, 255, 255))
-            draw.rectangle([70, 180, 186, 210], fill=(255, 255, 255, 255))
-            
-            # Save the image as .ico
-            img.save(icon_path, format='ICO')
-            print(f"Created basic icon at {icon_path}")
-        except ImportError:
-            print("Pillow not installed. Skipping icon creation.")
-            print("You can create your own icon and place it at: invoicetaxapp/resources/icon.ico")
-
-def build_windows_executable(verbose=False, one_file=True, icon_path=None):
-    """Build Windows executable with PyInstaller"""
-    print("Building Windows executable...")
+    # An icon without a signature file was supplied by the user and is kept as is
+    if icon_path.exists() and (not sig_path.exists() or sig_path.read_text() == ICON_SIGNATURE):
+        return
     
+    print("No up-to-date icon found. Creating a basic icon...")
+    try:
+        from PIL import Image
+        from io import BytesIO
+        
+        # Decode the prebaked icon, drawing it only if the literal is unavailable
+        if _ICON_PNG_B64:
+            img = Image.open(BytesIO(base64.b64decode(_ICON_PNG_B64)))
+        else:
+            img = _draw_icon()
+        
+        # Save the image as .ico
+        img.save(icon_path, format='ICO')
+        sig_path.write_text(ICON_SIGNATURE)
+        print(f"Created basic icon at {icon_path}")
+    except ImportError:
+        print("Pillow not installed. Skipping icon creation.")
+        print("You can create your own icon and place it at: invoicetaxapp/resources/icon.ico")
+
+def _find_iscc():
+    """Locate the Inno Setup compiler once, returning "" if it isn't installed"""
+    global _ISCC_PATH
+    if _ISCC_PATH is None:
+        search_path = os.pathsep.join(INNO_SETUP_DIRS + [os.environ.get("PATH", "")])
+        _ISCC_PATH = shutil.which("ISCC.exe", path=search_path) or ""
+    return _ISCC_PATH
+
+def _build_executable(sep, verbose=False, one_file=True, icon_path=None, set_icon=True,
+                      kind="executable", output=f"dist/{APP_NAME}"):
+    """
+    Build the executable with PyInstaller
+    
+    Args:
+        sep (str): --add-data source/destination separator (";" on Windows, ":" elsewhere)
+        verbose (bool): Show PyInstaller output
+        one_file (bool): Build a single-file executable
+        icon_path (str): Custom icon path, defaults to the bundled icon
+        set_icon (bool): Also use the icon for the executable itself
+        kind (str): Name of the artifact used in messages
+        output (str): Path of the artifact PyInstaller produces
+        
+    Returns:
+        bool: Whether the build succeeded
+    """
     # Prepare PyInstaller command
     pyinstaller_args = [
         "pyinstaller",
@@ -87,6 +213,9 @@ def build_windows_executable(verbose=False, one_file=True, icon_path=None):
     if one_file:
         pyinstaller_args.append("--onefile")
     
+    # Reuse the cached analysis from previous builds (no --clean)
+    pyinstaller_args.extend(["--workpath", PYI_WORKPATH, "--distpath", "dist", "--noconfirm"])
+    
     # Add icon if specified or if exists in default location
     if icon_path:
         icon_path = Path(icon_path)
@@ -94,138 +223,51 @@ def build_windows_executable(verbose=False, one_file=True, icon_path=None):
         icon_path = Path("invoicetaxapp/resources/icon.ico")
     
     if icon_path.exists():
-        pyinstaller_args.append(f"--icon={icon_path}")
+        if set_icon:
+            pyinstaller_args.append(f"--icon={icon_path}")
         # Also add as data file
-        pyinstaller_args.append(f"--add-data={icon_path};resources")
+        pyinstaller_args.append(f"--add-data={icon_path}{sep}resources")
     
     # Add data directories
     for data_dir in ["data", "exports"]:
         if os.path.exists(data_dir):
-            pyinstaller_args.append(f"--add-data={data_dir};{data_dir}")
+            pyinstaller_args.append(f"--add-data={data_dir}{sep}{data_dir}")
     
     # Add main script
     pyinstaller_args.append("invoicetaxapp/app.py")
     
     # Run PyInstaller
     try:
-        if verbose:
-            subprocess.check_call(pyinstaller_args)
-        else:
-            subprocess.check_call(pyinstaller_args, stdout=subprocess.DEVNULL)
-        print(f"Executable created successfully: dist/{APP_NAME}.exe")
+        _run(pyinstaller_args, verbose, _PYINSTALLER_ENV)
+        print(f"{kind.capitalize()} created successfully: {output}")
         return True
     except subprocess.CalledProcessError as e:
-        print(f"Error building executable: {e}")
+        print(f"Error building {kind}: {e}")
         return False
 
+def build_windows_executable(verbose=False, one_file=True, icon_path=None):
+    """Build Windows executable with PyInstaller"""
+    print("Building Windows executable...")
+    return _build_executable(";", verbose, one_file, icon_path, output=f"dist/{APP_NAME}.exe")
+
 def build_macos_executable(verbose=False, one_file=True, icon_path=None):
     """Build macOS executable with PyInstaller"""
     print("Building macOS application...")
-    
-    # Prepare PyInstaller command
-    pyinstaller_args = [
-        "pyinstaller",
-        f"--name={APP_NAME}",
-        "--windowed",
-    ]
-    
-    if one_file:
-        pyinstaller_args.append("--onefile")
-    
-    # Add icon if specified or if exists in default location
-    if icon_path:
-        icon_path = Path(icon_path)
-    else:
-        # For macOS, ideally use .icns format
-        icon_path = Path("invoicetaxapp/resources/icon.ico")
-    
-    if icon_path.exists():
-        pyinstaller_args.append(f"--icon={icon_path}")
-        # Also add as data file, note the colon separator for macOS
-        pyinstaller_args.append(f"--add-data={icon_path}:resources")
-    
-    # Add data directories
-    for data_dir in ["data", "exports"]:
-        if os.path.exists(data_dir):
-            pyinstaller_args.append(f"--add-data={data_dir}:{data_dir}")
-    
-    # Add main script
-    pyinstaller_args.append("invoicetaxapp/app.py")
-    
-    # Run PyInstaller
-    try:
-        if verbose:
-            subprocess.check_call(pyinstaller_args)
-        else:
-            subprocess.check_call(pyinstaller_args, stdout=subprocess.DEVNULL)
-        print(f"Application created successfully: dist/{APP_NAME}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error building application: {e}")
-        return False
+    # For macOS, ideally use an .icns icon
+    return _build_executable(":", verbose, one_file, icon_path, kind="application")
 
 def build_linux_executable(verbose=False, one_file=True, icon_path=None):
     """Build Linux executable with PyInstaller"""
     print("Building Linux executable...")
-    
-    # Prepare PyInstaller command
-    pyinstaller_args = [
-        "pyinstaller",
-        f"--name={APP_NAME}",
-        "--windowed",
-    ]
-    
-    if one_file:
-        pyinstaller_args.append("--onefile")
-    
-    # Add icon if specified or if exists in default location
-    if icon_path:
-        icon_path = Path(icon_path)
-    else:
-        icon_path = Path("invoicetaxapp/resources/icon.ico")
-    
-    if icon_path.exists():
-        # Also add as data file, note the colon separator for Linux
-        pyinstaller_args.append(f"--add-data={icon_path}:resources")
-    
-    # Add data directories
-    for data_dir in ["data", "exports"]:
-        if os.path.exists(data_dir):
-            pyinstaller_args.append(f"--add-data={data_dir}:{data_dir}")
-    
-    # Add main script
-    pyinstaller_args.append("invoicetaxapp/app.py")
-    
-    # Run PyInstaller
-    try:
-        if verbose:
-            subprocess.check_call(pyinstaller_args)
-        else:
-            subprocess.check_call(pyinstaller_args, stdout=subprocess.DEVNULL)
-        print(f"Executable created successfully: dist/{APP_NAME}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error building executable: {e}")
-        return False
+    # Linux executables carry no icon; it is only bundled as a data file
+    return _build_executable(":", verbose, one_file, icon_path, set_icon=False)
 
 def create_windows_installer(verbose=False):
     """Create Windows installer using Inno Setup"""
     print("Creating Windows installer...")
     
     # Check if Inno Setup is installed
-    inno_setup_path = None
-    possible_paths = [
-        r"C:\Program Files\Inno Setup 6\ISCC.exe",
-        r"C:\Program Files (x86)\Inno Setup 6\ISCC.exe",
-        r"C:\Program Files\Inno Setup 5\ISCC.exe",
-        r"C:\Program Files (x86)\Inno Setup 5\ISCC.exe"
-    ]
-    
-    for path in possible_paths:
-        if os.path.exists(path):
-            inno_setup_path = path
-            break
-    
+    inno_setup_path = _find_iscc()
     if not inno_setup_path:
         print("Inno Setup not found. Please install Inno Setup from https://jrsoftware.org/isdl.php")
         print("Skipping installer creation.")
@@ -263,18 +305,39 @@ Filename: "{{app}}\\{APP_NAME}.exe"; Description: "Launch {APP_NAME}"; Flags: no
     # Create installer directory if it doesn't exist
     os.makedirs("installer", exist_ok=True)
     
-    # Write script to file
+    # Fingerprint the script together with the files it packages
+    fingerprint = hashlib.sha256(iss_script.encode())
+    for source in (f"dist/{APP_NAME}.exe", "README.md"):
+        if os.path.exists(source):
+            stat = os.stat(source)
+            fingerprint.update(f"{source}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    fingerprint = fingerprint.hexdigest()
+    
+    fingerprint_file = Path("installer/.iss.sha")
+    output_file = Path(f"installer/{APP_NAME}_Setup.exe")
+    try:
+        if fingerprint_file.read_text() == fingerprint and output_file.exists():
+            print(f"Installer up to date: {output_file}")
+            return True
+    except OSError:
+        pass
+    
+    # Write script to file, leaving it untouched if the content is the same
     iss_file = "installer_script.iss"
-    with open(iss_file, "w") as f:
-        f.write(iss_script)
+    try:
+        with open(iss_file) as f:
+            unchanged = f.read() == iss_script
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        with open(iss_file, "w") as f:
+            f.write(iss_script)
     
     # Run Inno Setup compiler
     try:
         inno_args = [inno_setup_path, iss_file]
-        if verbose:
-            subprocess.check_call(inno_args)
-        else:
-            subprocess.check_call(inno_args, stdout=subprocess.DEVNULL)
+        _run(inno_args, verbose)
+        fingerprint_file.write_text(fingerprint)
         print(f"Installer created successfully: installer/{APP_NAME}_Setup.exe")
         return True
     except subprocess.CalledProcessError as e:
@@ -323,7 +386,7 @@ def organize_project_files():
     if not os.path.exists(requirements_file):
         with open(requirements_file, "w") as f:
             f.write("tkcalendar>=1.6.1\n")
-            f.write("pdfplumber>=0.7.6\n")
+            f.write("PyMuPDF>=1.23.0\n")
             f.write("pillow>=9.3.0\n")
             f.write("pyinstaller>=5.6.0\n")
     
@@ -337,7 +400,9 @@ def main():
     parser.add_argument('--no-onefile', action='store_true', help='Create a directory-based executable instead of a single file')
     parser.add_argument('--icon', help='Path to custom icon file')
     parser.add_argument('--skip-deps', action='store_true', help='Skip dependency installation')
+    parser.add_argument('--force-deps', action='store_true', help='Install dependencies even if requirements.txt is unchanged')
     parser.add_argument('--installer', action='store_true', help='Create installer (Windows only)')
+    parser.add_argument('--fresh', action='store_true', help='Discard the cached PyInstaller build and rebuild from scratch')
     
     args = parser.parse_args()
     
@@ -346,19 +411,29 @@ def main():
     # Check Python version
     check_python_version()
     
-    # Set up project files
+    # Set up project files (this also writes requirements.txt if it is missing)
     organize_project_files()
     
-    # Create an icon if missing
-    create_icon_if_missing()
-    
-    # Install dependencies if needed
-    if not args.skip_deps:
-        try:
-            install_dependencies(args.verbose)
-        except subprocess.CalledProcessError as e:
-            print(f"Error installing dependencies: {e}")
-            sys.exit(1)
+    # Install dependencies in the background while the icon is created
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        deps_future = None
+        if not args.skip_deps:
+            deps_future = executor.submit(install_dependencies, args.verbose, args.force_deps)
+        
+        # Create an icon if missing
+        create_icon_if_missing()
+        
+        # Wait for the dependencies before building
+        if deps_future is not None:
+            try:
+                deps_future.result()
+            except subprocess.CalledProcessError as e:
+                print(f"Error installing dependencies: {e}")
+                sys.exit(1)
+    
+    # Drop the cached PyInstaller analysis if a fresh build was requested
+    if args.fresh:
+        shutil.rmtree(PYI_WORKPATH, ignore_errors=True)
     
     # Build executable based on platform
     system = platform.system()
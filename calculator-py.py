@@ -5,18 +5,53 @@ This module contains the BusinessTaxCalculator class which handles
 all tax calculations, invoice management, and data persistence.
 """
 
+import contextlib
 import datetime
 import json
+import math
 import os
 import calendar
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Iterable, Iterator, Tuple, Optional
 import csv
+import functools
+
+# Optional acceleration: NumPy keeps the invoice columns in contiguous arrays
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional acceleration: orjson parses and serializes the data file in C
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Quarter bounds never change, so they are computed once per (year, quarter)
+_QUARTER_BOUNDS: Dict[Tuple[int, int], Tuple[datetime.date, datetime.date]] = {}
+_QUARTER_ORDS: Dict[Tuple[int, int], Tuple[int, int]] = {}
+
+
+def _synchronized(method):
+    """Run a BusinessTaxCalculator method while holding the calculator's lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 @dataclass
 class Invoice:
     """Data class for invoice information"""
+    # No per-instance __dict__; declared by hand since dataclass(slots=True) needs Python 3.10
+    __slots__ = ("date", "amount", "description", "invoice_id")
+    
     date: datetime.date
     amount: float
     description: str
@@ -50,60 +85,174 @@ class BusinessTaxCalculator:
         self.fed_tax_rate = fed_tax_rate
         self.state_tax_rate = state_tax_rate
         self.state_code = state_code
-        self.invoices = []
+        # Keyed by invoice ID, in insertion order
+        self._invoices_by_id: Dict[str, Invoice] = {}
+        
+        # Bumped whenever the invoice list changes; used to invalidate caches
+        self.version = 0
+        self._sorted_invoices = None
+        self._sorted_version = -1
+        self._columns = None
+        self._columns_version = -1
+        
+        # The app calls into the calculator from several worker threads; the
+        # invoices, the cached sorted list and columns and the batch state
+        # are only touched while holding this
+        self._lock = threading.RLock()
+        
+        # Saving is deferred while a batch() block is open
+        self._autosave = True
+        self._dirty = False
+        
+        # Files are written on a background thread; queued saves collapse into one
+        self._save_executor = ThreadPoolExecutor(max_workers=1)
+        self._save_lock = threading.Lock()
+        self._pending_payload = None
+        self._save_queued = False
+        self._last_save = None
+        
         self.load_invoices()
         
     def load_invoices(self) -> None:
         """Load invoices from the data file if it exists"""
         if os.path.exists(self.data_file):
             try:
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.data_file, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
                     
-                self.invoices = []
+                invoices_by_id = {}
                 for inv in data.get('invoices', []):
-                    # Convert string date to datetime.date
-                    date_parts = [int(x) for x in inv['date'].split('-')]
-                    date = datetime.date(date_parts[0], date_parts[1], date_parts[2])
-                    
-                    self.invoices.append(Invoice(
-                        date=date,
+                    invoice = Invoice(
+                        date=datetime.date.fromisoformat(inv['date']),
                         amount=float(inv['amount']),
                         description=inv['description'],
                         invoice_id=inv['invoice_id']
-                    ))
+                    )
+                    if invoice.invoice_id in invoices_by_id:
+                        # Older files could hold repeated IDs; keep every invoice
+                        invoice.invoice_id = self._unique_id(invoice.invoice_id, invoices_by_id)
+                        print(f"Duplicate invoice ID {inv['invoice_id']} renamed to {invoice.invoice_id}")
+                    invoices_by_id[invoice.invoice_id] = invoice
+                self._invoices_by_id = invoices_by_id
                     
                 self.fed_tax_rate = data.get('fed_tax_rate', self.fed_tax_rate)
                 self.state_tax_rate = data.get('state_tax_rate', self.state_tax_rate)
                 self.state_code = data.get('state_code', self.state_code)
                 
-            except (json.JSONDecodeError, KeyError, ValueError, IndexError) as e:
+            except (json.JSONDecodeError, KeyError, ValueError, IndexError, TypeError) as e:
                 print(f"Error loading invoices: {e}")
-                self.invoices = []
+                self._invoices_by_id = {}
+            
+            self.version += 1
+    
+    @property
+    def invoices(self) -> List[Invoice]:
+        """List of invoices in insertion order"""
+        return list(self._invoices_by_id.values())
+    
+    @staticmethod
+    def _unique_id(invoice_id: str, taken: Dict[str, Invoice]) -> str:
+        """
+        Make an invoice ID unique by adding a numeric suffix
+        
+        Args:
+            invoice_id (str): Preferred invoice ID
+            taken (Dict[str, Invoice]): Invoices keyed by the IDs already in use
+            
+        Returns:
+            str: ID not present in taken
+        """
+        suffix = 1
+        candidate = f"{invoice_id}-{suffix}"
+        while candidate in taken:
+            suffix += 1
+            candidate = f"{invoice_id}-{suffix}"
+        return candidate
     
+    @_synchronized
     def save_invoices(self) -> None:
-        """Save invoices to the data file"""
-        data = {
+        """
+        Save invoices to the data file
+        
+        The data is serialized on the calling thread, so later changes can't
+        leak into it, and written on a background thread. If an earlier save
+        is still waiting to be written it is replaced by this one.
+        """
+        try:
+            payload = self._serialize()
+        except Exception as e:
+            print(f"Failed to save invoices: {e}")
+            return
+        data_file = self.data_file
+        
+        with self._save_lock:
+            self._pending_payload = (data_file, payload)
+            if not self._save_queued:
+                self._save_queued = True
+                self._last_save = self._save_executor.submit(self._write_pending)
+    
+    def _serialize(self) -> bytes:
+        """
+        Serialize settings and invoices to JSON
+        
+        Returns:
+            bytes: UTF-8 encoded JSON document
+        """
+        settings = {
             'fed_tax_rate': self.fed_tax_rate,
             'state_tax_rate': self.state_tax_rate,
             'state_code': self.state_code,
-            'invoices': [
-                {
-                    'date': inv.date.isoformat(),
-                    'amount': inv.amount,
-                    'description': inv.description,
-                    'invoice_id': inv.invoice_id
-                }
-                for inv in self.invoices
-            ]
         }
         
+        if orjson is not None:
+            settings['invoices'] = self.invoices
+            return orjson.dumps(settings, option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_INDENT_2)
+        
+        # Without orjson, write one invoice per line
+        parts = ['{\n']
+        for key, value in settings.items():
+            parts.append(f'  {json.dumps(key)}: {json.dumps(value)},\n')
+        
+        parts.append('  "invoices": [')
+        for i, inv in enumerate(self._invoices_by_id.values()):
+            record = json.dumps({
+                'date': inv.date.isoformat(),
+                'amount': inv.amount,
+                'description': inv.description,
+                'invoice_id': inv.invoice_id
+            })
+            parts.append(f'{"," if i else ""}\n    {record}')
+        parts.append('\n  ]\n}\n')
+        return ''.join(parts).encode('utf-8')
+    
+    def _write_pending(self) -> None:
+        """Write the most recent payload to a temporary file and swap it into place"""
+        with self._save_lock:
+            data_file, payload = self._pending_payload
+            self._pending_payload = None
+            self._save_queued = False
+        
         try:
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._write_file(data_file, payload)
         except Exception as e:
             print(f"Failed to save invoices: {e}")
     
+    @staticmethod
+    def _write_file(data_file: str, payload: bytes) -> None:
+        """
+        Replace a file's contents atomically
+        
+        Args:
+            data_file (str): File to write
+            payload (bytes): New contents
+        """
+        tmp_file = data_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, data_file)
+    
+    @_synchronized
     def add_invoice(self, date: datetime.date, amount: float, description: str, invoice_id: str = None) -> Tuple[bool, str]:
         """
         Add a new invoice
@@ -118,9 +267,28 @@ class BusinessTaxCalculator:
             Tuple[bool, str]: Success status and message
         """
         try:
+            # Check the values before storing them: an invoice the data file
+            # can't hold would make every later save fail
+            if isinstance(date, datetime.datetime):
+                date = date.date()
+            elif not isinstance(date, datetime.date):
+                return False, f"Invalid invoice date: {date!r}"
+            if not isinstance(description, str):
+                return False, f"Invalid invoice description: {description!r}"
+            # orjson rejects float subclasses such as numpy.float64, and json
+            # rejects Decimal, so amounts are stored as plain floats
+            amount = float(amount)
+            # orjson writes inf and nan as null, which can't be loaded back
+            if not math.isfinite(amount):
+                return False, f"Invalid invoice amount: {amount}"
+            
             # Generate invoice ID if not provided
             if invoice_id is None:
-                invoice_id = f"INV-{date.strftime('%Y%m%d')}-{len(self.invoices):04d}"
+                invoice_id = f"INV-{date.strftime('%Y%m%d')}-{len(self._invoices_by_id):04d}"
+                if invoice_id in self._invoices_by_id:
+                    invoice_id = self._unique_id(invoice_id, self._invoices_by_id)
+            elif invoice_id in self._invoices_by_id:
+                return False, f"Invoice {invoice_id} already exists."
             
             # Create and add invoice
             invoice = Invoice(
@@ -130,13 +298,36 @@ class BusinessTaxCalculator:
                 invoice_id=invoice_id
             )
             
-            self.invoices.append(invoice)
-            self.save_invoices()
+            self._invoices_by_id[invoice_id] = invoice
+            self._invoices_changed(added=invoice)
             return True, f"Invoice {invoice_id} added successfully."
             
         except Exception as e:
             return False, f"Error adding invoice: {e}"
     
+    @_synchronized
+    def add_invoices_bulk(self, rows: Iterable[Tuple[datetime.date, float, str]]) -> Tuple[bool, str]:
+        """
+        Add several invoices and save them in a single write
+        
+        Args:
+            rows (Iterable[Tuple[datetime.date, float, str]]): Date, amount and description of each invoice
+            
+        Returns:
+            Tuple[bool, str]: Success status and message
+        """
+        count = 0
+        with self.batch():
+            for date, amount, description in rows:
+                success, message = self.add_invoice(date, amount, description)
+                if not success:
+                    # The invoices added so far are kept and saved when the batch exits
+                    return False, f"{count} invoices added before an error: {message}"
+                count += 1
+        
+        return True, f"{count} invoices added successfully."
+    
+    @_synchronized
     def delete_invoice(self, invoice_id: str) -> Tuple[bool, str]:
         """
         Delete an invoice by ID
@@ -147,13 +338,102 @@ class BusinessTaxCalculator:
         Returns:
             Tuple[bool, str]: Success status and message
         """
-        for i, inv in enumerate(self.invoices):
-            if inv.invoice_id == invoice_id:
-                del self.invoices[i]
-                self.save_invoices()
-                return True, f"Invoice {invoice_id} deleted."
+        invoice = self._invoices_by_id.pop(invoice_id, None)
+        if invoice is None:
+            return False, f"Invoice {invoice_id} not found."
+        
+        self._invoices_changed(removed=invoice)
+        return True, f"Invoice {invoice_id} deleted."
+    
+    @_synchronized
+    def delete_invoices_bulk(self, invoice_ids: Iterable[str]) -> Tuple[bool, str]:
+        """
+        Delete several invoices and save the result in a single write
+        
+        Args:
+            invoice_ids (Iterable[str]): IDs of invoices to delete
+            
+        Returns:
+            Tuple[bool, str]: Success status and message
+        """
+        deleted = 0
+        missing = []
+        with self.batch():
+            for invoice_id in invoice_ids:
+                success, _ = self.delete_invoice(invoice_id)
+                if success:
+                    deleted += 1
+                else:
+                    missing.append(invoice_id)
         
-        return False, f"Invoice {invoice_id} not found."
+        if missing:
+            return False, f"{deleted} invoices deleted; not found: {', '.join(missing)}"
+        return True, f"{deleted} invoices deleted."
+    
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Defer saving until the end of the block
+        
+        Changes made inside the block are written with a single save when the
+        outermost batch exits.
+        """
+        # Held for the whole block so other threads can't see it half done
+        with self._lock:
+            autosave = self._autosave
+            self._autosave = False
+            try:
+                yield self
+            finally:
+                self._autosave = autosave
+                if autosave and self._dirty:
+                    self._dirty = False
+                    self.save_invoices()
+    
+    @_synchronized
+    def flush(self) -> None:
+        """Save the invoices if there are unsaved changes and wait for pending writes"""
+        if self._dirty:
+            self._dirty = False
+            self.save_invoices()
+        
+        with self._save_lock:
+            last_save = self._last_save
+        if last_save is not None:
+            last_save.result()
+    
+    def close(self) -> None:
+        """Write any outstanding changes and stop the background writer"""
+        self.flush()
+        self._save_executor.shutdown(wait=True)
+    
+    def _invoices_changed(self, added: Optional[Invoice] = None, removed: Optional[Invoice] = None) -> None:
+        """
+        Record a change to the invoice list and save it unless a batch is open
+        
+        Outside a batch, a single added or removed invoice is patched into the
+        cached sorted list and columns instead of invalidating them. Inside a
+        batch the caches are simply rebuilt once on the next query.
+        
+        Args:
+            added (Invoice, optional): Invoice that was added
+            removed (Invoice, optional): Invoice that was removed
+        """
+        patch = (self._autosave and (added is not None or removed is not None) and
+                 self._sorted_version == self._columns_version == self.version)
+        self.version += 1
+        
+        if patch:
+            if added is not None:
+                self._insert_sorted(added)
+            else:
+                self._remove_sorted(removed)
+            self._sorted_version = self._columns_version = self.version
+        
+        if self._autosave:
+            self.save_invoices()
+        else:
+            self._dirty = True
     
     def get_quarter_bounds(self, year: int, quarter: int) -> Tuple[datetime.date, datetime.date]:
         """
@@ -166,6 +446,10 @@ class BusinessTaxCalculator:
         Returns:
             Tuple[datetime.date, datetime.date]: Start date and end date
         """
+        bounds = _QUARTER_BOUNDS.get((year, quarter))
+        if bounds is not None:
+            return bounds
+        
         if quarter < 1 or quarter > 4:
             raise ValueError("Quarter must be between 1 and 4")
             
@@ -176,8 +460,26 @@ class BusinessTaxCalculator:
         last_day = calendar.monthrange(year, end_month)[1]
         end_date = datetime.date(year, end_month, last_day)
         
+        _QUARTER_BOUNDS[(year, quarter)] = start_date, end_date
         return start_date, end_date
     
+    def _quarter_ordinals(self, year: int, quarter: int) -> Tuple[int, int]:
+        """
+        Get the start and end of a quarter as date ordinals
+        
+        Args:
+            year (int): Year
+            quarter (int): Quarter (1-4)
+            
+        Returns:
+            Tuple[int, int]: Start and end ordinals
+        """
+        ords = _QUARTER_ORDS.get((year, quarter))
+        if ords is None:
+            start_date, end_date = self.get_quarter_bounds(year, quarter)
+            ords = _QUARTER_ORDS[(year, quarter)] = (start_date.toordinal(), end_date.toordinal())
+        return ords
+    
     def get_quarterly_earnings(self, year: int, quarter: int) -> float:
         """
         Calculate earnings for a specific quarter
@@ -189,14 +491,7 @@ class BusinessTaxCalculator:
         Returns:
             float: Total earnings for the quarter
         """
-        start_date, end_date = self.get_quarter_bounds(year, quarter)
-        
-        total = 0.0
-        for inv in self.invoices:
-            if start_date <= inv.date <= end_date:
-                total += inv.amount
-                
-        return total
+        return self._period_totals(*self._quarter_ordinals(year, quarter))[0]
 
     def get_yearly_earnings(self, year: int) -> float:
         """
@@ -208,15 +503,143 @@ class BusinessTaxCalculator:
         Returns:
             float: Total earnings for the year
         """
-        start_date = datetime.date(year, 1, 1)
-        end_date = datetime.date(year, 12, 31)
+        start_ord = self._quarter_ordinals(year, 1)[0]
+        end_ord = self._quarter_ordinals(year, 4)[1]
+        return self._period_totals(start_ord, end_ord)[0]
+    
+    @_synchronized
+    def _invoice_columns(self):
+        """
+        Get invoice amounts and date ordinals as parallel columns sorted by date
         
-        total = 0.0
-        for inv in self.invoices:
-            if start_date <= inv.date <= end_date:
-                total += inv.amount
-                
-        return total
+        The columns are rebuilt only when the invoices change. They are NumPy
+        arrays when NumPy is installed, an array of doubles and a list otherwise.
+        
+        Returns:
+            Tuple: Amounts and date ordinals
+        """
+        if self._columns_version != self.version:
+            invoices = self.get_all_invoices()
+            if np is not None:
+                count = len(invoices)
+                amounts = np.fromiter((inv.amount for inv in invoices), dtype=np.float64, count=count)
+                ordinals = np.fromiter((inv.date.toordinal() for inv in invoices), dtype=np.int64, count=count)
+            else:
+                amounts = array('d', (inv.amount for inv in invoices))
+                ordinals = [inv.date.toordinal() for inv in invoices]
+            self._columns = (amounts, ordinals)
+            self._columns_version = self.version
+        return self._columns
+    
+    def _insert_sorted(self, invoice: Invoice) -> None:
+        """
+        Insert an invoice into the cached sorted list and columns
+        
+        It goes after any invoices with the same date, where sorting the
+        whole list again would have put it. New lists and arrays are built
+        rather than changing the cached ones, which callers may still hold.
+        
+        Args:
+            invoice (Invoice): Invoice to insert
+        """
+        amounts, ordinals = self._columns
+        ordinal = invoice.date.toordinal()
+        
+        if np is not None:
+            i = int(np.searchsorted(ordinals, ordinal, side='right'))
+            amounts = np.insert(amounts, i, invoice.amount)
+            ordinals = np.insert(ordinals, i, ordinal)
+        else:
+            i = bisect_right(ordinals, ordinal)
+            amounts = amounts[:i] + array('d', (invoice.amount,)) + amounts[i:]
+            ordinals = ordinals[:i] + [ordinal] + ordinals[i:]
+        
+        self._sorted_invoices = self._sorted_invoices[:i] + [invoice] + self._sorted_invoices[i:]
+        self._columns = (amounts, ordinals)
+    
+    def _remove_sorted(self, invoice: Invoice) -> None:
+        """
+        Remove an invoice from the cached sorted list and columns
+        
+        Args:
+            invoice (Invoice): Invoice to remove
+        """
+        amounts, ordinals = self._columns
+        ordinal = invoice.date.toordinal()
+        
+        # Only the invoices sharing its date need to be checked
+        if np is not None:
+            lo, hi = np.searchsorted(ordinals, [ordinal, ordinal + 1], side='left').tolist()
+        else:
+            lo, hi = bisect_left(ordinals, ordinal), bisect_right(ordinals, ordinal)
+        i = next(k for k in range(lo, hi) if self._sorted_invoices[k] is invoice)
+        
+        if np is not None:
+            amounts = np.delete(amounts, i)
+            ordinals = np.delete(ordinals, i)
+        else:
+            amounts = amounts[:i] + amounts[i + 1:]
+            ordinals = ordinals[:i] + ordinals[i + 1:]
+        
+        self._sorted_invoices = self._sorted_invoices[:i] + self._sorted_invoices[i + 1:]
+        self._columns = (amounts, ordinals)
+    
+    @_synchronized
+    def _range_totals(self, edges: List[int]) -> List[Tuple[float, int]]:
+        """
+        Sum invoices between consecutive date ordinal edges
+        
+        Each range is half-open, [edges[i], edges[i + 1]). Because the columns
+        are sorted by date, every range is found with a binary search and
+        summed as one contiguous slice.
+        
+        Args:
+            edges (List[int]): Ascending date ordinals
+            
+        Returns:
+            List[Tuple[float, int]]: Earnings and invoice count for each range
+        """
+        amounts, ordinals = self._invoice_columns()
+        
+        if np is not None:
+            positions = np.searchsorted(ordinals, edges, side='left').tolist()
+            # fsum gives the exactly rounded total, the same with or without NumPy
+            return [(math.fsum(amounts[lo:hi].tolist()), hi - lo) for lo, hi in zip(positions, positions[1:])]
+        
+        positions = [bisect_left(ordinals, edge) for edge in edges]
+        return [(math.fsum(amounts[lo:hi]), hi - lo) for lo, hi in zip(positions, positions[1:])]
+    
+    def _period_totals(self, start_ord: int, end_ord: int) -> Tuple[float, float, float, int]:
+        """
+        Aggregate earnings and taxes for invoices between two date ordinals (inclusive)
+        
+        Args:
+            start_ord (int): Ordinal of the start date
+            end_ord (int): Ordinal of the end date
+            
+        Returns:
+            Tuple[float, float, float, int]: Earnings, federal tax, state tax and invoice count
+        """
+        gross, count = self._range_totals([start_ord, end_ord + 1])[0]
+        return gross, gross * self.fed_tax_rate, gross * self.state_tax_rate, count
+    
+    def _quarterly_totals(self, year: int) -> Tuple[List[float], List[int], float]:
+        """
+        Earnings and invoice counts for each quarter of a year, plus the yearly earnings
+        
+        Args:
+            year (int): Year
+            
+        Returns:
+            Tuple[List[float], List[int], float]: Earnings and invoice counts, indexed by
+            quarter - 1, and the earnings for the whole year
+        """
+        edges = [self._quarter_ordinals(year, q)[0] for q in range(1, 5)]
+        edges.append(self._quarter_ordinals(year, 4)[1] + 1)
+        totals = self._range_totals(edges)
+        # Summed as one slice rather than from the quarter totals so it matches get_yearly_earnings
+        yearly_earnings = self._range_totals([edges[0], edges[-1]])[0][0]
+        return [earnings for earnings, _ in totals], [count for _, count in totals], yearly_earnings
     
     def calculate_quarterly_federal_tax(self, year: int, quarter: int) -> float:
         """
@@ -256,8 +679,19 @@ class BusinessTaxCalculator:
         Returns:
             Dict: Contribution limits information
         """
-        yearly_earnings = self.get_yearly_earnings(year)
+        return self._sep_401k_limit(self.get_yearly_earnings(year))
+    
+    @staticmethod
+    def _sep_401k_limit(yearly_earnings: float) -> Dict:
+        """
+        Calculate SEP 401(k) contribution limits from yearly earnings
         
+        Args:
+            yearly_earnings (float): Earnings for the year
+            
+        Returns:
+            Dict: Contribution limits information
+        """
         # SEP IRA contribution limit calculation
         # For self-employed, the limit is approximately 20% of net income due to deduction calculation
         effective_rate = 0.20  # Simplified calculation
@@ -277,15 +711,32 @@ class BusinessTaxCalculator:
             'contribution_percent': 0 if yearly_earnings == 0 else (actual_contribution / yearly_earnings * 100)
         }
     
+    @_synchronized
     def get_all_invoices(self) -> List[Invoice]:
         """
         Get all invoices
         
+        The sorted list is cached until the invoices change, so callers
+        must not modify it.
+        
         Returns:
             List[Invoice]: List of all invoices, sorted by date
         """
-        return sorted(self.invoices, key=lambda x: x.date)
+        if self._sorted_version != self.version:
+            self._sorted_invoices = sorted(self._invoices_by_id.values(), key=lambda x: x.date)
+            self._sorted_version = self.version
+        return self._sorted_invoices
+    
+    def iter_all_invoices(self) -> Iterator[Invoice]:
+        """
+        Iterate over all invoices without building a new list
+        
+        Returns:
+            Iterator[Invoice]: Invoices in date order
+        """
+        yield from self.get_all_invoices()
     
+    @_synchronized
     def set_tax_rates(self, fed_rate: float, state_rate: float, state_code: str) -> Tuple[bool, str]:
         """
         Set new tax rates
@@ -299,8 +750,9 @@ class BusinessTaxCalculator:
             Tuple[bool, str]: Success status and message
         """
         if 0.0 <= fed_rate <= 1.0 and 0.0 <= state_rate <= 1.0:
-            self.fed_tax_rate = fed_rate
-            self.state_tax_rate = state_rate
+            # Plain floats, so numpy or Decimal rates can still be saved
+            self.fed_tax_rate = float(fed_rate)
+            self.state_tax_rate = float(state_rate)
             self.state_code = state_code
             self.save_invoices()
             return True, f"Tax rates updated: Federal {fed_rate:.2%}, State {state_rate:.2%} ({state_code})"
@@ -318,17 +770,20 @@ class BusinessTaxCalculator:
             Tuple[bool, str]: Success status and message
         """
         try:
-            with open(filename, 'w', newline='') as csvfile:
+            # A 1 MiB buffer turns the per-row writes into a few large ones
+            with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow(['Invoice ID', 'Date', 'Amount', 'Description'])
-                
-                for inv in sorted(self.invoices, key=lambda x: x.date):
-                    writer.writerow([inv.invoice_id, inv.date.isoformat(), inv.amount, inv.description])
+                writer.writerows(
+                    (inv.invoice_id, inv.date.isoformat(), inv.amount, inv.description)
+                    for inv in self.iter_all_invoices()
+                )
             
-            return True, f"Exported {len(self.invoices)} invoices to {filename}"
+            return True, f"Exported {len(self._invoices_by_id)} invoices to {filename}"
         except Exception as e:
             return False, f"Export failed: {e}"
     
+    @_synchronized
     def generate_quarterly_report(self, year: int, quarter: int = None) -> Dict:
         """
         Generate a quarterly report
@@ -341,6 +796,8 @@ class BusinessTaxCalculator:
             Dict: Report data
         """
         if quarter is not None:
+            if quarter < 1 or quarter > 4:
+                raise ValueError("Quarter must be between 1 and 4")
             quarters = [quarter]
         else:
             quarters = [1, 2, 3, 4]
@@ -350,28 +807,30 @@ class BusinessTaxCalculator:
             'quarters': {}
         }
         
+        # One pass over the date-sorted columns covers every quarter and the year
+        quarter_earnings, quarter_counts, yearly_earnings = self._quarterly_totals(year)
+        
         for q in quarters:
-            earnings = self.get_quarterly_earnings(year, q)
-            fed_tax = self.calculate_quarterly_federal_tax(year, q)
-            state_tax = self.calculate_quarterly_state_tax(year, q)
-            
-            start_date, end_date = self.get_quarter_bounds(year, q)
-            invoices = [inv for inv in self.invoices if start_date <= inv.date <= end_date]
+            earnings = quarter_earnings[q - 1]
+            fed_tax = earnings * self.fed_tax_rate
+            state_tax = earnings * self.state_tax_rate
+            invoice_count = quarter_counts[q - 1]
             
             report['quarters'][q] = {
                 'earnings': earnings,
                 'fed_tax': fed_tax,
                 'state_tax': state_tax,
                 'total_tax': fed_tax + state_tax,
-                'invoice_count': len(invoices)
+                'invoice_count': invoice_count
             }
         
         # Add SEP 401(k) contribution information if generating full year report
         if quarter is None:
-            report['sep_401k'] = self.calculate_sep_401k_limit(year)
+            report['sep_401k'] = self._sep_401k_limit(yearly_earnings)
         
         return report
 
+    @_synchronized
     def change_data_location(self, new_location: str) -> Tuple[bool, str]:
         """
         Change the data file location
@@ -382,11 +841,27 @@ class BusinessTaxCalculator:
         Returns:
             Tuple[bool, str]: Success status and message
         """
+        old_data_file = self.data_file
         try:
-            # Save current data to new location
-            old_data_file = self.data_file
+            # Bring the current file up to date and make sure no write is still in flight
+            self.flush()
+            
+            new_dir = os.path.dirname(new_location)
+            if new_dir:
+                os.makedirs(new_dir, exist_ok=True)
+            
+            # Moving the existing file is a rename when both paths are on the same filesystem
+            if os.path.exists(old_data_file):
+                try:
+                    os.replace(old_data_file, new_location)
+                    self.data_file = new_location
+                    return True, f"Data location changed to {new_location}"
+                except OSError:
+                    pass
+            
+            # Otherwise write a fresh copy, synchronously so a bad location is reported
+            self._write_file(new_location, self._serialize())
             self.data_file = new_location
-            self.save_invoices()
             return True, f"Data location changed to {new_location}"
         except Exception as e:
             # Revert if failed
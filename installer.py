@@ -2,6 +2,14 @@ import os
 import sys
 import subprocess
 import platform
+import shutil
+
+# PyInstaller keeps its analysis here between builds so rebuilds are incremental
+PYI_WORKPATH = "build/pyi-cache"
+PYI_CACHE_ARGS = ["--workpath", PYI_WORKPATH, "--distpath", "dist", "--noconfirm"]
+
+# Bundle modules compiled with -OO (no docstrings or asserts)
+PYI_ENV = {**os.environ, "PYTHONOPTIMIZE": "2"}
 
 def install_dependencies():
     """Install required dependencies"""
@@ -23,10 +31,11 @@ def build_installer():
             "--name=InvoiceTaxApp",
             "--windowed",
             "--onefile",
+            *PYI_CACHE_ARGS,
             "--add-data=invoicetaxapp/resources/icon.ico;resources",
             "--icon=invoicetaxapp/resources/icon.ico",
             "invoicetaxapp/app.py"
-        ])
+        ], env=PYI_ENV)
         
         print("Executable created in dist/InvoiceTaxApp.exe")
         
@@ -45,10 +54,11 @@ def build_installer():
             "--name=InvoiceTaxApp",
             "--windowed",
             "--onefile",
+            *PYI_CACHE_ARGS,
             "--add-data=invoicetaxapp/resources/icon.ico:resources",
             "--icon=invoicetaxapp/resources/icon.ico",
             "invoicetaxapp/app.py"
-        ])
+        ], env=PYI_ENV)
         print("Executable created in dist/InvoiceTaxApp")
     
     else:  # Linux
@@ -57,11 +67,14 @@ def build_installer():
             "--name=InvoiceTaxApp",
             "--windowed",
             "--onefile",
+            *PYI_CACHE_ARGS,
             "--add-data=invoicetaxapp/resources/icon.ico:resources",
             "invoicetaxapp/app.py"
-        ])
+        ], env=PYI_ENV)
         print("Executable created in dist/InvoiceTaxApp")
 
 if __name__ == "__main__":
+    if "--fresh" in sys.argv:
+        shutil.rmtree(PYI_WORKPATH, ignore_errors=True)
     install_dependencies()
     build_installer()
\ No newline at end of file
@@ -6,21 +6,310 @@ extraction of invoice data from PDF documents.
 """
 
 import datetime
+import io
+import os
 import re
-import pdfplumber
-from typing import List, Dict
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from operator import itemgetter
+from typing import List, Dict, Iterable, Iterator, Tuple, Optional
+
+# PyMuPDF parses pages in C and is much faster than pdfplumber's pdfminer
+# backend; it comes with the "fast" extra, otherwise pdfplumber is used
+try:
+    import pymupdf
+except ImportError:
+    try:
+        import fitz as pymupdf  # PyMuPDF before 1.24
+    except ImportError:
+        pymupdf = None
+
+if pymupdf is None:
+    import pdfplumber
+
+# Optional acceleration: Hyperscan checks page text against all text patterns in one pass
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+# Patterns are compiled once at import and shared by every extraction call
+
+# Currency symbols, thousands separators and anything else that isn't part of a number
+_AMOUNT_CLEAN_RE = re.compile(r'[^\d.]')
+
+# Leading characters _parse_amount strips without the regex
+_CURRENCY_SYMBOLS = '$€£¥ '
+
+
+def _parse_amount(amount_str: str) -> float:
+    """
+    Parse an amount cell, ignoring currency symbols and thousands separators
+    
+    Args:
+        amount_str: Stripped amount text, e.g. "$1,234.56"
+        
+    Returns:
+        float: The amount
+        
+    Raises:
+        ValueError: If no number is left once the other characters are removed
+    """
+    # Most cells are a number with thousands separators and a leading
+    # currency symbol; when dropping just those leaves a plain number it is
+    # what the regex would produce, so the regex only runs for other cells
+    plain = amount_str.replace(',', '').lstrip(_CURRENCY_SYMBOLS)
+    if plain.replace('.', '', 1).isdecimal():
+        return float(plain)
+    return float(_AMOUNT_CLEAN_RE.sub('', amount_str))
+
+
+# Text-based fallback patterns for pages without a usable invoice table
+_INVOICE_TEXT_PATTERNS = [
+    # Pattern for "Invoice: XXX Date: MM/DD/YYYY Amount: $X,XXX.XX"
+    re.compile(r'Invoice[:\s]+([^\s]+).*?Date[:\s]+(\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{1,2}-\d{1,2}).*?Amount[:\s]+[$£€]?([0-9,.]+)',
+               re.IGNORECASE),
+    # Pattern for table-like structure in text
+    re.compile(r'Invoice\s+([^\s]+)\s+(\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{1,2}-\d{1,2})\s+[$£€]?([0-9,.]+)',
+               re.IGNORECASE),
+]
+
+
+def _compile_text_prefilter():
+    """
+    Compile the text patterns into one Hyperscan database
+    
+    Returns:
+        hyperscan.Database: Database reporting which patterns occur in a text, or None
+    """
+    if hyperscan is None:
+        return None
+    
+    # UCP keeps \s and \d Unicode-aware like Python's str patterns
+    flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 |
+             hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH)
+    # re.IGNORECASE also lets the Turkish dotted and dotless I match "i";
+    # Hyperscan's caseless mode doesn't, so they are spelled out. No other
+    # letter in the patterns has a non-ASCII case variant in re.
+    expressions = [pattern.pattern.replace('Invoice', '[i\u0130\u0131]nvo[i\u0130\u0131]ce').encode('utf-8')
+                   for pattern in _INVOICE_TEXT_PATTERNS]
+    db = hyperscan.Database()
+    try:
+        db.compile(
+            expressions=expressions,
+            ids=list(range(len(_INVOICE_TEXT_PATTERNS))),
+            elements=len(_INVOICE_TEXT_PATTERNS),
+            flags=[flags] * len(_INVOICE_TEXT_PATTERNS),
+        )
+    except hyperscan.error as e:
+        print(f"Hyperscan unavailable for text patterns: {e}")
+        return None
+    return db
+
+
+_TEXT_PREFILTER = _compile_text_prefilter()
+
+
+def _matching_text_patterns(text: str) -> List:
+    """
+    Text patterns that can match somewhere in a page's text
+    
+    Hyperscan can't backtrack, so this costs one linear pass however the
+    text is laid out; only the patterns it finds are run with re to
+    extract their groups. Without Hyperscan every pattern is returned.
+    
+    Args:
+        text (str): Page text
+        
+    Returns:
+        List: Compiled patterns from _INVOICE_TEXT_PATTERNS, in order
+    """
+    if _TEXT_PREFILTER is None:
+        return _INVOICE_TEXT_PATTERNS
+    
+    found = set()
+    
+    def on_match(pattern_id, start, end, flags, context):
+        found.add(pattern_id)
+        # Stop scanning once every pattern has been seen
+        return len(found) == len(_INVOICE_TEXT_PATTERNS)
+    
+    try:
+        data = text.encode('utf-8')
+    except UnicodeEncodeError:
+        # Lone surrogates can't be encoded as valid UTF-8, which Hyperscan
+        # requires in UTF-8 mode; re handles them, so try every pattern
+        return _INVOICE_TEXT_PATTERNS
+    
+    try:
+        _TEXT_PREFILTER.scan(data, match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        pass
+    except hyperscan.error:
+        # e.g. the shared scratch space is busy in another thread
+        return _INVOICE_TEXT_PATTERNS
+    return [pattern for i, pattern in enumerate(_INVOICE_TEXT_PATTERNS) if i in found]
+
+
+def _parse_date(date_str: str) -> Optional[datetime.date]:
+    """
+    Parse a remittance advice date without going through strptime.
+    
+    Accepts DD/MM/YYYY (falling back to MM/DD/YYYY when that is not a valid
+    date), YYYY-MM-DD, DD-MM-YYYY and DD.MM.YYYY, with one- or two-digit
+    day and month fields.
+    
+    Args:
+        date_str: Stripped date text from a table cell
+        
+    Returns:
+        The parsed date, or None if the text is not a valid date
+    """
+    # Zero-padded dates have fixed positions, so slice them without searching
+    if len(date_str) == 10 and date_str[4] == '-' == date_str[7]:
+        sep = '-'
+        first, second, third = date_str[:4], date_str[5:7], date_str[8:]
+    elif len(date_str) == 10 and date_str[2] == date_str[5] and date_str[2] in '/-.':
+        sep = date_str[2]
+        first, second, third = date_str[:2], date_str[3:5], date_str[6:]
+    else:
+        for sep in '/-.':
+            if sep in date_str:
+                break
+        else:
+            return None
+        
+        parts = date_str.split(sep)
+        if len(parts) != 3:
+            return None
+        first, second, third = parts
+    
+    # Empty fields pass this check but fail int() below
+    if not (first + second + third).isdecimal():
+        return None
+    
+    try:
+        if len(first) == 4:
+            if sep != '-' or len(second) > 2 or len(third) > 2:
+                return None
+            return datetime.date(int(first), int(second), int(third))
+        
+        if len(first) > 2 or len(second) > 2 or len(third) != 4:
+            return None
+        day, month, year = int(first), int(second), int(third)
+        if sep == '/':
+            try:
+                return datetime.date(year, month, day)
+            except ValueError:
+                return datetime.date(year, day, month)
+        return datetime.date(year, month, day)
+    except ValueError:
+        return None
+
+
+# Words the text of a page must contain for it to hold an invoice table
+_INVOICE_TABLE_WORDS = ("invoice", "date", "amount")
+
+# Pages per worker process below which extract_from_pdf stays in-process
+PARALLEL_MIN_PAGES = 8
+
+# pdfminer makes many small reads, so pdfplumber parses PDFs up to this
+# size from an in-memory copy; larger files are still read from disk
+MAX_BUFFERED_PDF_BYTES = 200 << 20
+
+
+def _open_pdf(pdf_path: str, page_numbers: Optional[List[int]] = None):
+    """
+    Open a PDF with the available backend, for use as a context manager
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        page_numbers (List[int], optional): Zero-based pages that will be read; all if None
+    """
+    if pymupdf is not None:
+        # MuPDF buffers its own reads; parsing from memory measured no faster
+        return pymupdf.open(pdf_path)
+    
+    source = pdf_path
+    if os.path.getsize(pdf_path) <= MAX_BUFFERED_PDF_BYTES:
+        with open(pdf_path, 'rb') as f:
+            source = io.BytesIO(f.read())
+    if page_numbers is not None:
+        # pdfplumber only parses the requested (one-based) pages
+        return pdfplumber.open(source, pages=[n + 1 for n in page_numbers])
+    return pdfplumber.open(source)
+
+
+def _page_count(pdf) -> int:
+    """Number of pages in a document opened with _open_pdf"""
+    return pdf.page_count if pymupdf is not None else len(pdf.pages)
+
+
+def _pages(pdf, page_numbers: Optional[List[int]] = None) -> Iterable:
+    """
+    Pages of a document opened with _open_pdf
+    
+    Args:
+        pdf: Open document
+        page_numbers (List[int], optional): Zero-based pages passed to _open_pdf, if any
+    """
+    if pymupdf is not None:
+        return pdf if page_numbers is None else (pdf[n] for n in page_numbers)
+    return _released_pages(pdf.pages)
+
+
+def _released_pages(pages: Iterable) -> Iterator:
+    """
+    Yield pdfplumber pages, dropping each one's parsed layout once the caller moves on
+    
+    pdfplumber otherwise keeps the characters and layout of every page it
+    has read until the document is closed, so memory grows with page count.
+    """
+    for page in pages:
+        yield page
+        if hasattr(page, 'close'):
+            page.close()
+        else:
+            page.flush_cache()
+
+
+def _page_text(page) -> str:
+    """Plain text of a page"""
+    if pymupdf is not None:
+        return page.get_text("text")
+    return page.extract_text() or ""
+
+
+def _page_tables(page) -> List[List[List[str]]]:
+    """Tables on a page, each as a list of rows of cell strings"""
+    if pymupdf is not None:
+        return [table.extract() for table in page.find_tables().tables]
+    return page.extract_tables()
 
 
 class PdfInvoiceExtractor:
     """Class for extracting invoice information from PDF files"""
     
+    # PDF library in use; the backends can lay out text and tables differently
+    BACKEND = "pymupdf" if pymupdf is not None else "pdfplumber"
+    
+    # Bump whenever a change could alter the invoices found in a PDF, so
+    # results cached by callers from older versions are not reused
+    VERSION = 1
+    
     @staticmethod
-    def extract_from_pdf(pdf_path: str) -> List[Dict]:
+    def extract_from_pdf(pdf_path: str, max_workers: Optional[int] = None) -> List[Dict]:
         """
         Extract invoice information from a PDF file
         
+        Long documents are split into runs of pages that are extracted in
+        parallel worker processes.
+        
         Args:
             pdf_path (str): Path to the PDF file
+            max_workers (int, optional): Limit on worker processes; 1 keeps extraction in-process
             
         Returns:
             List[Dict]: List of invoice dictionaries
@@ -28,141 +317,264 @@ class PdfInvoiceExtractor:
         invoices = []
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    # Extract text from page
-                    text = page.extract_text()
+            with _open_pdf(pdf_path) as pdf:
+                page_count = _page_count(pdf)
+                workers = min(max_workers or os.cpu_count() or 1, page_count // PARALLEL_MIN_PAGES)
+                
+                if workers <= 1:
+                    # Short documents aren't worth the worker start-up cost
+                    for page in _pages(pdf):
+                        table_invoices, text_invoices = PdfInvoiceExtractor._extract_page(page, not invoices)
+                        invoices.extend(table_invoices)
+                        if not invoices:
+                            invoices.extend(text_invoices)
+                    return invoices
+            
+            # Split the pages into contiguous runs, a few per worker
+            chunk_size = -(-page_count // (workers * 4))
+            chunks = [list(range(start, min(start + chunk_size, page_count)))
+                      for start in range(0, page_count, chunk_size)]
+            
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                for results in ex.map(PdfInvoiceExtractor._extract_pages, repeat(pdf_path), chunks):
+                    # Text matches only count until a page has yielded invoices, as above
+                    for table_invoices, text_invoices in results:
+                        invoices.extend(table_invoices)
+                        if not invoices:
+                            invoices.extend(text_invoices)
+            
+            return invoices
+            
+        except Exception as e:
+            print(f"Error extracting from PDF: {e}")
+            return []
+    
+    @staticmethod
+    def _extract_page(page, text_fallback: bool = True, text: Optional[str] = None,
+                      tables: Optional[List] = None) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Extract invoice information from a single page
+        
+        Args:
+            page: Page of a document opened with _open_pdf
+            text_fallback (bool): Scan the page text when the page's tables yield no invoices
+            text (str, optional): The page text, if already extracted
+            tables (List, optional): The page tables, if already detected
+            
+        Returns:
+            Tuple[List[Dict], List[Dict]]: Invoices from tables and invoices from the page text
+        """
+        invoices = []
+        text_invoices = []
+        
+        # Extract text from page
+        if text is None:
+            text = _page_text(page)
+        
+        # Look for invoice table
+        # Table detection is expensive, so only try it when the page text
+        # contains every word an invoice table header must have
+        if tables is None:
+            text_lower = text.lower()
+            if all(word in text_lower for word in _INVOICE_TABLE_WORDS):
+                tables = _page_tables(page)
+            else:
+                tables = []
+        
+        for table in tables:
+            # Look for table with invoice-related headers
+            headers = [str(h).strip().lower() if h else "" for h in table[0]]
+            
+            # Check if this looks like an invoice table; none of the words
+            # contain a space, so searching the joined headers is the same
+            # as searching each one
+            joined = " ".join(headers)
+            if all(word in joined for word in _INVOICE_TABLE_WORDS):
+                
+                # Find column indices
+                try:
+                    doc_type_idx = next(i for i, h in enumerate(headers) if "type" in h)
+                    doc_num_idx = next(i for i, h in enumerate(headers) if "number" in h)
+                    date_idx = next(i for i, h in enumerate(headers) if "date" in h)
+                    amount_idx = next(i for i, h in enumerate(headers) if "amount" in h)
+                    currency_idx = next(i for i, h in enumerate(headers) if "currency" in h)
+                except StopIteration:
+                    continue
+                
+                column_indices = (doc_type_idx, doc_num_idx, date_idx, amount_idx, currency_idx)
+                max_idx = max(column_indices)
+                # Type, number, date and amount must all be present
+                required_cells = itemgetter(*column_indices[:4])
+                
+                # Process rows (skip header)
+                for row in table[1:]:
+                    # Drop short rows and rows with an empty required cell
+                    # before cleaning any of their cells
+                    if not row or len(row) <= max_idx or not all(required_cells(row)):
+                        continue
                     
-                    # Look for invoice table
-                    # Try to find a table with invoice data
-                    tables = page.extract_tables()
+                    doc_type, doc_num, date_str, amount_str, currency = [
+                        str(row[i]).strip() if row[i] else "" for i in column_indices
+                    ]
                     
-                    for table in tables:
-                        # Look for table with invoice-related headers
-                        headers = [str(h).strip() if h else "" for h in table[0]]
-                        
-                        # Check if this looks like an invoice table
-                        if (any("invoice" in h.lower() for h in headers) and 
-                            any("date" in h.lower() for h in headers) and
-                            any("amount" in h.lower() for h in headers)):
-                            
-                            # Find column indices
-                            try:
-                                doc_type_idx = next(i for i, h in enumerate(headers) if "type" in h.lower())
-                                doc_num_idx = next(i for i, h in enumerate(headers) if "number" in h.lower())
-                                date_idx = next(i for i, h in enumerate(headers) if "date" in h.lower())
-                                amount_idx = next(i for i, h in enumerate(headers) if "amount" in h.lower())
-                                currency_idx = next(i for i, h in enumerate(headers) if "currency" in h.lower())
-                            except StopIteration:
-                                continue
-                            
-                            # Process rows (skip header)
-                            for row in table[1:]:
-                                if not row or not any(row):
-                                    continue
-                                
-                                # Clean and validate row data
-                                if len(row) <= max(doc_type_idx, doc_num_idx, date_idx, amount_idx, currency_idx):
-                                    continue
-                                
-                                doc_type = str(row[doc_type_idx]).strip() if row[doc_type_idx] else ""
-                                doc_num = str(row[doc_num_idx]).strip() if row[doc_num_idx] else ""
-                                date_str = str(row[date_idx]).strip() if row[date_idx] else ""
-                                amount_str = str(row[amount_idx]).strip() if row[amount_idx] else ""
-                                currency = str(row[currency_idx]).strip() if row[currency_idx] else ""
-                                
-                                # Skip empty rows
-                                if not doc_type or not doc_num or not date_str or not amount_str:
-                                    continue
-                                
-                                # Parse date (handle different formats)
-                                try:
-                                    # Try DD/MM/YYYY format
-                                    if '/' in date_str:
-                                        date_parts = date_str.split('/')
-                                        if len(date_parts) == 3:
-                                            date = datetime.date(int(date_parts[2]), int(date_parts[1]), int(date_parts[0]))
-                                    # Try YYYY-MM-DD format
-                                    elif '-' in date_str:
-                                        date_parts = date_str.split('-')
-                                        if len(date_parts) == 3:
-                                            date = datetime.date(int(date_parts[0]), int(date_parts[1]), int(date_parts[2]))
-                                    else:
-                                        # Skip rows with invalid dates
-                                        continue
-                                except (ValueError, IndexError):
-                                    # Skip rows with invalid dates
-                                    continue
-                                
-                                # Parse amount (handle currency symbols and commas)
-                                try:
-                                    # Remove currency symbols, commas, and spaces
-                                    amount_clean = re.sub(r'[^\d.]', '', amount_str)
-                                    amount = float(amount_clean)
-                                except ValueError:
-                                    # Skip rows with invalid amounts
-                                    continue
-                                
-                                # Add invoice to list
-                                invoice = {
-                                    'date': date,
-                                    'amount': amount,
-                                    'description': f"{doc_type}: {doc_num}",
-                                    'currency': currency,
-                                    'doc_number': doc_num
-                                }
-                                
-                                invoices.append(invoice)
+                    # Skip empty rows
+                    if not doc_type or not doc_num or not date_str or not amount_str:
+                        continue
+                    
+                    # Interned so every row in a currency shares one string,
+                    # which pickling to the app or the cache also stores once
+                    currency = sys.intern(currency)
+                    
+                    # Parse date (handle different formats)
+                    try:
+                        # Try DD/MM/YYYY format
+                        if '/' in date_str:
+                            date_parts = date_str.split('/')
+                            if len(date_parts) == 3:
+                                date = datetime.date(int(date_parts[2]), int(date_parts[1]), int(date_parts[0]))
+                        # Try YYYY-MM-DD format
+                        elif '-' in date_str:
+                            date_parts = date_str.split('-')
+                            if len(date_parts) == 3:
+                                date = datetime.date(int(date_parts[0]), int(date_parts[1]), int(date_parts[2]))
+                        else:
+                            # Skip rows with invalid dates
+                            continue
+                    except (ValueError, IndexError):
+                        # Skip rows with invalid dates
+                        continue
+                    
+                    # Parse amount (handle currency symbols and commas)
+                    try:
+                        amount = _parse_amount(amount_str)
+                    except ValueError:
+                        # Skip rows with invalid amounts
+                        continue
+                    
+                    # Add invoice to list
+                    invoice = {
+                        'date': date,
+                        'amount': amount,
+                        'description': f"{doc_type}: {doc_num}",
+                        'currency': currency,
+                        'doc_number': doc_num
+                    }
+                    
+                    invoices.append(invoice)
+        
+        # If no tables were found or extracted, try text-based extraction
+        # Every text pattern starts with "Invoice", so pages without it are
+        # skipped before any regex runs. re.IGNORECASE also lets the Turkish
+        # dotted and dotless I stand in for either "i", so only the "nvo"
+        # between them, which has no such variants, is checked.
+        if text_fallback and not invoices and "nvo" in text.lower():
+            # Look for patterns like "Invoice XXX-XXX-XXX Date: MM/DD/YYYY Amount: $X,XXX.XX"
+            for pattern in _matching_text_patterns(text):
+                matches = pattern.findall(text)
+                for match in matches:
+                    doc_num, date_str, amount_str = match
+                    
+                    # Parse date
+                    try:
+                        if '/' in date_str:
+                            date_parts = date_str.split('/')
+                            date = datetime.date(int(date_parts[2]), int(date_parts[1]), int(date_parts[0]))
+                        else:
+                            date_parts = date_str.split('-')
+                            date = datetime.date(int(date_parts[0]), int(date_parts[1]), int(date_parts[2]))
+                    except (ValueError, IndexError):
+                        continue
+                    
+                    # Parse amount
+                    try:
+                        amount = _parse_amount(amount_str)
+                    except ValueError:
+                        continue
+                    
+                    # Add invoice to list
+                    invoice = {
+                        'date': date,
+                        'amount': amount,
+                        'description': f"Invoice: {doc_num}",
+                        'currency': 'USD',  # Default currency if not specified
+                        'doc_number': doc_num
+                    }
+                    
+                    text_invoices.append(invoice)
+        
+        return invoices, text_invoices
+    
+    @staticmethod
+    def _extract_pages(pdf_path: str, page_numbers: List[int]) -> List[Tuple[List[Dict], List[Dict]]]:
+        """
+        Extract invoice information from some pages of a PDF file, in a worker process
+        
+        Args:
+            pdf_path (str): Path to the PDF file
+            page_numbers (List[int]): Zero-based page numbers
+            
+        Returns:
+            List[Tuple[List[Dict], List[Dict]]]: _extract_page results for each page
+        """
+        with _open_pdf(pdf_path, page_numbers) as pdf:
+            return [PdfInvoiceExtractor._extract_page(page) for page in _pages(pdf, page_numbers)]
+    
+    @staticmethod
+    def extract_from_pdf_batch(pdf_paths: Iterable[str]) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        Extract invoice information from several PDF files in turn
+        
+        Args:
+            pdf_paths (Iterable[str]): Paths to the PDF files
+            
+        Yields:
+            Tuple[str, List[Dict]]: Each path with its list of invoice dictionaries
+        """
+        for pdf_path in pdf_paths:
+            yield pdf_path, PdfInvoiceExtractor.extract_from_pdf(pdf_path)
+    
+    @staticmethod
+    def extract_with_remittance(pdf_path: str) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Run extract_from_pdf and extract_from_remittance_advice in one pass
+        
+        Each page's text is extracted and its tables detected once and shared
+        by both, instead of parsing the whole document twice.
+        
+        Args:
+            pdf_path (str): Path to the PDF file
+            
+        Returns:
+            Tuple[List[Dict], List[Dict]]: The invoices each of the two methods would return
+        """
+        invoices = []
+        remittance_invoices = []
+        
+        try:
+            with _open_pdf(pdf_path) as pdf:
+                for page in _pages(pdf):
+                    text = _page_text(page)
+                    text_lower = text.lower()
                     
-                    # If no tables were found or extracted, try text-based extraction
+                    # Detect tables once if either extractor wants them
+                    has_invoice_table = all(word in text_lower for word in _INVOICE_TABLE_WORDS)
+                    is_remittance = "remittance advice" in text_lower
+                    tables = _page_tables(page) if has_invoice_table or is_remittance else []
+                    
+                    table_invoices, text_invoices = PdfInvoiceExtractor._extract_page(
+                        page, not invoices, text, tables if has_invoice_table else [])
+                    invoices.extend(table_invoices)
                     if not invoices:
-                        # Look for patterns like "Invoice XXX-XXX-XXX Date: MM/DD/YYYY Amount: $X,XXX.XX"
-                        invoice_patterns = [
-                            # Pattern for "Invoice: XXX Date: MM/DD/YYYY Amount: $X,XXX.XX"
-                            r'Invoice[:\s]+([^\s]+).*?Date[:\s]+(\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{1,2}-\d{1,2}).*?Amount[:\s]+[$£€]?([0-9,.]+)',
-                            # Pattern for table-like structure in text
-                            r'Invoice\s+([^\s]+)\s+(\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{1,2}-\d{1,2})\s+[$£€]?([0-9,.]+)'
-                        ]
-                        
-                        for pattern in invoice_patterns:
-                            matches = re.findall(pattern, text, re.IGNORECASE)
-                            for match in matches:
-                                doc_num, date_str, amount_str = match
-                                
-                                # Parse date
-                                try:
-                                    if '/' in date_str:
-                                        date_parts = date_str.split('/')
-                                        date = datetime.date(int(date_parts[2]), int(date_parts[1]), int(date_parts[0]))
-                                    else:
-                                        date_parts = date_str.split('-')
-                                        date = datetime.date(int(date_parts[0]), int(date_parts[1]), int(date_parts[2]))
-                                except (ValueError, IndexError):
-                                    continue
-                                
-                                # Parse amount
-                                try:
-                                    amount_clean = re.sub(r'[^\d.]', '', amount_str)
-                                    amount = float(amount_clean)
-                                except ValueError:
-                                    continue
-                                
-                                # Add invoice to list
-                                invoice = {
-                                    'date': date,
-                                    'amount': amount,
-                                    'description': f"Invoice: {doc_num}",
-                                    'currency': 'USD',  # Default currency if not specified
-                                    'doc_number': doc_num
-                                }
-                                
-                                invoices.append(invoice)
+                        invoices.extend(text_invoices)
+                    
+                    if is_remittance:
+                        remittance_invoices.extend(PdfInvoiceExtractor._iter_remittance_tables(tables))
             
-            return invoices
+            return invoices, remittance_invoices
             
         except Exception as e:
             print(f"Error extracting from PDF: {e}")
-            return []
+            return [], []
     
     @staticmethod
     def extract_from_remittance_advice(pdf_path: str) -> List[Dict]:
@@ -175,124 +587,144 @@ class PdfInvoiceExtractor:
         Returns:
             List[Dict]: List of invoice dictionaries
         """
-        invoices = []
-        
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    # Extract text and tables
-                    text = page.extract_text()
-                    tables = page.extract_tables()
-                    
-                    # Check if this is a remittance advice
-                    if "remittance advice" in text.lower():
-                        # Look for tables with invoice data
-                        for table in tables:
-                            if len(table) < 2:  # Need at least header and one data row
-                                continue
-                                
-                            # Check if this table has invoice-like headers
-                            headers = [str(col).strip().lower() if col else "" for col in table[0]]
-                            
-                            # Common header patterns in remittance advice
-                            if (("document" in " ".join(headers) or "invoice" in " ".join(headers)) and
-                                ("date" in " ".join(headers)) and
-                                ("amount" in " ".join(headers))):
-                                
-                                # Find the relevant column indices
-                                doc_type_idx = None
-                                doc_num_idx = None
-                                date_idx = None
-                                amount_idx = None
-                                currency_idx = None
-                                
-                                for i, header in enumerate(headers):
-                                    if "type" in header and "document" in header:
-                                        doc_type_idx = i
-                                    elif "number" in header and ("document" in header or "invoice" in header):
-                                        doc_num_idx = i
-                                    elif "date" in header:
-                                        date_idx = i
-                                    elif "amount" in header and "payment" in header:
-                                        amount_idx = i
-                                    elif "currency" in header:
-                                        currency_idx = i
-                                
-                                # Skip if we can't identify the necessary columns
-                                if None in (doc_type_idx, doc_num_idx, date_idx, amount_idx):
-                                    continue
-                                
-                                # Process data rows (skip header)
-                                for row in table[1:]:
-                                    if not row or len(row) <= max(doc_type_idx, doc_num_idx, date_idx, amount_idx):
-                                        continue
-                                    
-                                    try:
-                                        # Extract data from row
-                                        doc_type = str(row[doc_type_idx]).strip() if row[doc_type_idx] else ""
-                                        doc_num = str(row[doc_num_idx]).strip() if row[doc_num_idx] else ""
-                                        date_str = str(row[date_idx]).strip() if row[date_idx] else ""
-                                        amount_str = str(row[amount_idx]).strip() if row[amount_idx] else ""
-                                        
-                                        # Currency might be in a separate column or part of amount
-                                        currency = "USD"  # Default
-                                        if currency_idx is not None and row[currency_idx]:
-                                            currency = str(row[currency_idx]).strip()
-                                        elif "USD" in amount_str or "$" in amount_str:
-                                            currency = "USD"
-                                        elif "EUR" in amount_str or "€" in amount_str:
-                                            currency = "EUR"
-                                        elif "GBP" in amount_str or "£" in amount_str:
-                                            currency = "GBP"
-                                        
-                                        # Skip if missing essential data
-                                        if not doc_num or not date_str or not amount_str:
-                                            continue
-                                        
-                                        # Parse date
-                                        date = None
-                                        date_formats = [
-                                            # Try various date formats
-                                            ('%d/%m/%Y', r'\d{1,2}/\d{1,2}/\d{4}'),
-                                            ('%m/%d/%Y', r'\d{1,2}/\d{1,2}/\d{4}'),
-                                            ('%Y-%m-%d', r'\d{4}-\d{1,2}-\d{1,2}'),
-                                            ('%d-%m-%Y', r'\d{1,2}-\d{1,2}-\d{4}'),
-                                            ('%d.%m.%Y', r'\d{1,2}\.\d{1,2}\.\d{4}')
-                                        ]
-                                        
-                                        for date_format, pattern in date_formats:
-                                            if re.match(pattern, date_str):
-                                                try:
-                                                    date = datetime.datetime.strptime(date_str, date_format).date()
-                                                    break
-                                                except ValueError:
-                                                    continue
-                                        
-                                        if date is None:
-                                            continue
-                                        
-                                        # Parse amount
-                                        # Remove currency symbols and non-numeric chars except decimal points
-                                        amount_clean = re.sub(r'[^\d.]', '', amount_str)
-                                        amount = float(amount_clean)
-                                        
-                                        # Create invoice dictionary
-                                        invoice = {
-                                            'date': date,
-                                            'amount': amount,
-                                            'description': f"{doc_type}: {doc_num}" if doc_type else f"Invoice: {doc_num}",
-                                            'currency': currency,
-                                            'doc_number': doc_num
-                                        }
-                                        
-                                        invoices.append(invoice)
-                                        
-                                    except (ValueError, IndexError) as e:
-                                        print(f"Error processing row: {e}")
-                                        continue
-            
-            return invoices
+            return list(PdfInvoiceExtractor.iter_remittance_advice(pdf_path))
             
         except Exception as e:
             print(f"Error extracting from remittance advice PDF: {e}")
             return []
+    
+    @staticmethod
+    def iter_remittance_advice(pdf_path: str) -> Iterator[Dict]:
+        """
+        Yield invoice information from a remittance advice PDF row by row
+        
+        Pages are read as the rows are consumed, so callers that handle each
+        invoice as it arrives use the same memory however long the PDF is.
+        Errors opening or reading the PDF propagate to the caller.
+        
+        Args:
+            pdf_path (str): Path to the PDF file
+            
+        Yields:
+            Dict: Invoice dictionary
+        """
+        with _open_pdf(pdf_path) as pdf:
+            for page in _pages(pdf):
+                # Extract text; tables are only needed on remittance advice pages
+                text = _page_text(page)
+                
+                # Check if this is a remittance advice
+                if "remittance advice" in text.lower():
+                    yield from PdfInvoiceExtractor._iter_remittance_tables(_page_tables(page))
+    
+    @staticmethod
+    def _iter_remittance_tables(tables: List) -> Iterator[Dict]:
+        """
+        Yield invoice information from the tables of a remittance advice page
+        
+        Args:
+            tables (List): Tables detected on the page
+            
+        Yields:
+            Dict: Invoice dictionary
+        """
+        # Malformed rows are counted and reported once per page rather than
+        # printed one by one, which stalls on PDFs with thousands of them
+        row_errors = 0
+        first_error = None
+        
+        # Look for tables with invoice data
+        for table in tables:
+            if len(table) < 2:  # Need at least header and one data row
+                continue
+                
+            # Check if this table has invoice-like headers
+            headers = [str(col).strip().lower() if col else "" for col in table[0]]
+            joined = " ".join(headers)
+            
+            # Common header patterns in remittance advice
+            if (("document" in joined or "invoice" in joined) and
+                ("date" in joined) and
+                ("amount" in joined)):
+                
+                # Find the relevant column indices
+                doc_type_idx = None
+                doc_num_idx = None
+                date_idx = None
+                amount_idx = None
+                currency_idx = None
+                
+                for i, header in enumerate(headers):
+                    if "type" in header and "document" in header:
+                        doc_type_idx = i
+                    elif "number" in header and ("document" in header or "invoice" in header):
+                        doc_num_idx = i
+                    elif "date" in header:
+                        date_idx = i
+                    elif "amount" in header and "payment" in header:
+                        amount_idx = i
+                    elif "currency" in header:
+                        currency_idx = i
+                
+                # Skip if we can't identify the necessary columns
+                if None in (doc_type_idx, doc_num_idx, date_idx, amount_idx):
+                    continue
+                
+                column_indices = (doc_type_idx, doc_num_idx, date_idx, amount_idx)
+                max_idx = max(column_indices)
+                
+                # Process data rows (skip header)
+                for row in table[1:]:
+                    if not row or len(row) <= max_idx:
+                        continue
+                    
+                    try:
+                        # Extract data from row
+                        doc_type, doc_num, date_str, amount_str = [
+                            str(row[i]).strip() if row[i] else "" for i in column_indices
+                        ]
+                        
+                        # Currency might be in a separate column or part of amount
+                        currency = "USD"  # Default
+                        if currency_idx is not None and row[currency_idx]:
+                            currency = sys.intern(str(row[currency_idx]).strip())
+                        elif "USD" in amount_str or "$" in amount_str:
+                            currency = "USD"
+                        elif "EUR" in amount_str or "€" in amount_str:
+                            currency = "EUR"
+                        elif "GBP" in amount_str or "£" in amount_str:
+                            currency = "GBP"
+                        
+                        # Skip if missing essential data
+                        if not doc_num or not date_str or not amount_str:
+                            continue
+                        
+                        # Parse date
+                        date = _parse_date(date_str)
+                        
+                        if date is None:
+                            continue
+                        
+                        # Parse amount, ignoring currency symbols and separators
+                        amount = _parse_amount(amount_str)
+                        
+                        # Create invoice dictionary
+                        invoice = {
+                            'date': date,
+                            'amount': amount,
+                            'description': f"{doc_type}: {doc_num}" if doc_type else f"Invoice: {doc_num}",
+                            'currency': currency,
+                            'doc_number': doc_num
+                        }
+                        
+                        yield invoice
+                        
+                    except (ValueError, IndexError) as e:
+                        row_errors += 1
+                        if first_error is None:
+                            first_error = e
+                        continue
+        
+        if row_errors:
+            print(f"Error processing {row_errors} row(s), first: {first_error}")
@@ -8,8 +8,24 @@ setup(
     install_requires=[
         "tkcalendar>=1.6.1",
         "pdfplumber>=0.7.6",
-        "pillow>=9.3.0",
     ],
+    extras_require={
+        # Vectorized tax aggregation, faster data file I/O and the PyMuPDF
+        # PDF backend, which the extractor uses instead of pdfplumber when present
+        'fast': [
+            "numpy",
+            "orjson",
+            "PyMuPDF>=1.23.0",
+        ],
+        # Generating the default icon in the build script
+        'icon': [
+            "pillow>=9.3.0",
+        ],
+        # Single-pass text pattern prefilter for PDF import (no Windows wheels)
+        'hyperscan': [
+            "hyperscan>=0.7",
+        ],
+    },
     entry_points={
         'console_scripts': [
             'invoicetaxapp=invoicetaxapp.app:main',